@@ -1,19 +1,66 @@
 import numpy as np
 import random
-import math
-from collections import defaultdict
+from collections import defaultdict, deque
+from scipy.spatial import cKDTree
+from agent_kernels import random_step, spiral_step, toward_target_step
+
+# Known-customer count at which a KD-tree beats a linear nearest search
+KDTREE_MIN_KNOWN = 8
+
+# Uniform samples drawn per refill of an agent's random buffer
+RAND_BUFFER_SIZE = 4096
+
+class _PoolField:
+    """Agent attribute stored in its row of the owning AgentPool's array"""
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, agent, owner=None):
+        if agent is None:
+            return self
+        return getattr(agent._pool, self.name)[agent._row].item()
+
+    def __set__(self, agent, value):
+        getattr(agent._pool, self.name)[agent._row] = value
+
+class _PoolPosition(_PoolField):
+    """Agent position, exposed as an (x, y) tuple of ints"""
+    def __get__(self, agent, owner=None):
+        if agent is None:
+            return self
+        return tuple(agent._pool.pos[agent._row].tolist())
 
 class Agent:
-    def __init__(self, id, pos, is_byzantine=False):
+    # Movement state lives in an AgentPool; every agent starts in a pool of its own
+    pos = _PoolPosition()
+    is_byzantine = _PoolField()
+    step = _PoolField()
+    direction = _PoolField()
+    spiral_length = _PoolField()
+    steps_in_current_direction = _PoolField()
+    turns_taken = _PoolField()
+    battery = _PoolField()
+    battery_drain_rate = _PoolField()
+    max_speed = _PoolField()
+    current_speed = _PoolField()
+    rotation = _PoolField()
+    turning_rate = _PoolField()
+
+    def __init__(self, id, pos, is_byzantine=False, *, num_customers):
+        AgentPool([self])
         self.id = id
         self.pos = pos  # (x, y) tuple
         self.is_byzantine = is_byzantine
-        self.knowledge = {}  # {customer_id: (x, y)}
+        # Known customer positions, row i is customer i (valid where knows[i])
+        self.knowledge_xy = np.full((num_customers, 2), -1, dtype=np.int16)
+        self.knows = np.zeros(num_customers, dtype=bool)
+        self._knowledge_index = None  # Cached (cKDTree, customer ids) over knowledge
+        self._knowledge_version = 0  # Bumped on every knowledge change
+        self._knowledge_dirty = False  # Changed since the last consensus round
         self.step = 0
         
         # Path-finding and movement patterns
-        self.direction = 0  # 0: right, 1: down, 2: left, 3: up
-        self.spiral_directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, down, left, up
+        self.direction = 0  # Index into agent_kernels.SPIRAL_DIRECTIONS: right, down, left, up
         self.spiral_length = 1  # Current length of spiral arm
         self.steps_in_current_direction = 0
         self.turns_taken = 0
@@ -33,19 +80,33 @@ class Agent:
         self.turning_rate = 15  # degrees per step
         
         # Visual elements for simulation
-        self.last_positions = []  # Track position history for path visualization
+        self.last_positions = deque(maxlen=20)  # Track position history for path visualization
         self.message_cooldown = 0  # Cooldown for showing messages
         self.delivery_attempt = False  # Flag for delivery animation
         
         # Byzantine behavior settings (if is_byzantine)
         self.lie_probability = 0.7  # Probability of reporting false information
         self.distortion_range = (-5, 5)  # Range for distorting coordinates
+        
+        # Pre-sampled uniforms for per-step randomness, refilled when used up
+        self._rng = np.random.default_rng()
+        self._u = self._rng.random(RAND_BUFFER_SIZE)
+        self._ui = 0
+
+    def _urand(self):
+        """Next uniform sample in [0, 1) from the pre-sampled buffer"""
+        v = self._u[self._ui]
+        self._ui += 1
+        if self._ui == RAND_BUFFER_SIZE:
+            self._u = self._rng.random(RAND_BUFFER_SIZE)
+            self._ui = 0
+        return v
 
     def drain_battery(self):
         """Simulate battery drainage"""
         # Higher speed = more battery usage
         speed_factor = self.current_speed / self.max_speed
-        self.battery -= self.battery_drain_rate * speed_factor * random.uniform(0.9, 1.1)
+        self.battery -= self.battery_drain_rate * speed_factor * (0.9 + 0.2 * self._urand())
         self.battery = max(0, self.battery)
         return self.battery > 0  # Return True if battery is not depleted
 
@@ -56,8 +117,8 @@ class Agent:
             # Calculate random wind effect (more pronounced at higher altitudes)
             # For simplicity, we'll just add a small offset to the position
             x, y = self.pos
-            x += wind_dx * random.uniform(0, 0.5)
-            y += wind_dy * random.uniform(0, 0.5)
+            x += wind_dx * 0.5 * self._urand()
+            y += wind_dy * 0.5 * self._urand()
             
             # Ensure position remains within grid
             x = max(0, min(int(x), 19))
@@ -66,183 +127,182 @@ class Agent:
 
     def move(self, env):
         """Move based on knowledge and state"""
-        # Check if battery is depleted
-        if not self.drain_battery():
-            # Battery is dead, drone cannot move
-            return
+        self._pool.move_rows(env, [self._row])
+
+    @property
+    def knowledge(self):
+        """Known customer positions as a {customer_id: (x, y)} dict (a snapshot)"""
+        cids = np.flatnonzero(self.knows)
+        return dict(zip(cids.tolist(), map(tuple, self.knowledge_xy[cids].tolist())))
+
+    def _nearest_known(self):
+        """Return the id of the nearest customer in our knowledge, or None"""
+        cids = np.flatnonzero(self.knows)
+        if cids.size == 0:
+            return None
+        if cids.size < KDTREE_MIN_KNOWN:
+            # Brute force wins for a handful of known customers
+            offsets = self.knowledge_xy[cids] - np.array(self.pos, dtype=np.int32)
+            return int(cids[np.argmin((offsets * offsets).sum(axis=1))])  # Squared Euclidean
         
-        # Byzantine agents sometimes move erratically
-        if self.is_byzantine and random.random() < 0.1:
-            self._move_random(env)
+        # Tree over known positions, rebuilt only after knowledge changes
+        if self._knowledge_index is None:
+            self._knowledge_index = (cKDTree(self.knowledge_xy[cids]), cids)
+        tree, cids = self._knowledge_index
+        _, idx = tree.query(self.pos, k=1)
+        return int(cids[idx])
+
+    def observe(self, env):
+        """Observe customers within sensing range"""
+        # Squared distance to every customer at once (Euclidean distance ≤ 3)
+        xy = env.customers
+        dx = xy[:, 0] - np.int32(self.pos[0])
+        dy = xy[:, 1] - np.int32(self.pos[1])
+        hits = np.flatnonzero(dx*dx + dy*dy <= 9)
+        if hits.size == 0:
             return
-            
-        # Choose movement strategy based on knowledge
-        if self.knowledge and not self.is_byzantine:
-            # Target-seeking movement when we know customer locations
-            self._move_toward_target(env)
-        else:
-            # Spiral search pattern when we don't know targets or if Byzantine
-            self._move_spiral(env)
-            
-        # Observe environment after moving
-        self.observe(env)
-        
-        # Keep track of position history (for visualization)
-        self.last_positions.append(self.pos)
-        if len(self.last_positions) > 20:  # Limit history length
-            self.last_positions.pop(0)
-
-    def _move_random(self, env):
-        """Move randomly - used by Byzantine agents occasionally"""
-        dx = random.choice([-1, 0, 1])
-        dy = random.choice([-1, 0, 1])
-        
-        # Update position within grid bounds
-        new_x = max(0, min(env.size-1, self.pos[0] + dx))
-        new_y = max(0, min(env.size-1, self.pos[1] + dy))
-        self.pos = (new_x, new_y)
-        self.step += 1
-
-    def _move_toward_target(self, env):
-        """Move toward the nearest known customer with realistic movement"""
-        # Find nearest customer from our knowledge
-        nearest_customer_id = None
-        nearest_distance = float('inf')
-        
-        for cid, pos in self.knowledge.items():
-            distance = math.sqrt((pos[0] - self.pos[0])**2 + (pos[1] - self.pos[1])**2)  # Euclidean
-            if distance < nearest_distance:
-                nearest_distance = distance
-                nearest_customer_id = cid
-        
-        if nearest_customer_id is not None:
-            target = self.knowledge[nearest_customer_id]
-            
-            # Calculate direction to target 
-            dx = target[0] - self.pos[0]
-            dy = target[1] - self.pos[1]
-            
-            # Calculate target angle
-            target_angle = math.degrees(math.atan2(dy, dx))
-            if target_angle < 0:
-                target_angle += 360
-                
-            # Gradually turn toward target (realistic turning)
-            angle_diff = ((target_angle - self.rotation + 180) % 360) - 180
-            if abs(angle_diff) > self.turning_rate:
-                # Cannot turn instantly, turn gradually
-                if angle_diff > 0:
-                    self.rotation = (self.rotation + self.turning_rate) % 360
-                else:
-                    self.rotation = (self.rotation - self.turning_rate) % 360
-            else:
-                # Close enough to target angle, set exactly
-                self.rotation = target_angle
-            
-            # Move forward in current rotation direction
-            move_dx = math.cos(math.radians(self.rotation)) * self.current_speed
-            move_dy = math.sin(math.radians(self.rotation)) * self.current_speed
-            
-            # Add small random movement occasionally to avoid getting stuck
-            if random.random() < 0.1:
-                move_dx += random.uniform(-0.2, 0.2)
-                move_dy += random.uniform(-0.2, 0.2)
-            
-            # Update position within grid bounds
-            new_x = max(0, min(env.size-1, int(self.pos[0] + move_dx)))
-            new_y = max(0, min(env.size-1, int(self.pos[1] + move_dy)))
-            self.pos = (new_x, new_y)
-            self.step += 1
-        else:
-            # Fall back to spiral search if no valid target
-            self._move_spiral(env)
-
-    def _move_spiral(self, env):
-        """Move in an outward spiral pattern to search efficiently"""
-        # Get current direction vector
-        dx, dy = self.spiral_directions[self.direction]
-        
-        # Calculate new position
-        new_x = max(0, min(env.size-1, self.pos[0] + dx))
-        new_y = max(0, min(env.size-1, self.pos[1] + dy))
         
-        # Update rotation based on direction
-        target_rotations = [0, 90, 180, 270]  # Right, down, left, up
-        target_rotation = target_rotations[self.direction]
+        seen = xy[hits]
+        if self.is_byzantine:
+            # Byzantine agent may lie: distort a random subset of the sightings
+            lies = self._rng.random(hits.size) < self.lie_probability
+            low, high = self.distortion_range
+            offsets = self._rng.integers(low, high + 1, size=seen.shape)
+            # Keep within grid bounds
+            seen = np.clip(seen + offsets * lies[:, None], 0, env.size-1)
         
-        # Gradually turn to target rotation
-        angle_diff = ((target_rotation - self.rotation + 180) % 360) - 180
-        if abs(angle_diff) > self.turning_rate:
-            # Turn gradually
-            if angle_diff > 0:
-                self.rotation = (self.rotation + self.turning_rate) % 360
-            else:
-                self.rotation = (self.rotation - self.turning_rate) % 360
-        else:
-            # Close enough to target rotation
-            self.rotation = target_rotation
-        
-        # Check if we hit a boundary and need to adjust
-        if new_x == self.pos[0] and new_y == self.pos[1]:
-            # We couldn't move in the desired direction (hit boundary)
-            # Change direction and try again
-            self.direction = (self.direction + 1) % 4
-            dx, dy = self.spiral_directions[self.direction]
-            new_x = max(0, min(env.size-1, self.pos[0] + dx))
-            new_y = max(0, min(env.size-1, self.pos[1] + dy))
-        
-        # Update position
-        self.pos = (new_x, new_y)
-        self.step += 1
-        
-        # Increment steps in current direction
-        self.steps_in_current_direction += 1
-        
-        # Check if we need to turn
-        if self.steps_in_current_direction >= self.spiral_length:
-            self.direction = (self.direction + 1) % 4
-            self.steps_in_current_direction = 0
-            self.turns_taken += 1
-            
-            # Increase spiral arm length every 2 turns
-            if self.turns_taken % 2 == 0:
-                self.spiral_length += 1
+        self.learn(hits, seen)
+        self.message_cooldown = 5  # Show message for 5 steps
 
-    def observe(self, env):
-        """Observe customers within sensing range"""
-        for i, (cx, cy) in enumerate(env.customers):
-            # Check if customer is within sensing range (Euclidean distance ≤ 3)
-            distance = math.sqrt((cx - self.pos[0])**2 + (cy - self.pos[1])**2)
-            
-            if distance <= 3:
-                if not self.is_byzantine:
-                    # Honest agent reports true coordinates
-                    self.knowledge[i] = (cx, cy)
-                    self.message_cooldown = 5  # Show message for 5 steps
-                else:
-                    # Byzantine agent may lie
-                    if random.random() < self.lie_probability:
-                        # Report false position
-                        fake_x = cx + random.randint(*self.distortion_range)
-                        fake_y = cy + random.randint(*self.distortion_range)
-                        # Keep within grid bounds
-                        fake_x = max(0, min(env.size-1, fake_x))
-                        fake_y = max(0, min(env.size-1, fake_y))
-                        self.knowledge[i] = (fake_x, fake_y)
-                    else:
-                        # Occasionally report true position
-                        self.knowledge[i] = (cx, cy)
-                    self.message_cooldown = 5
+    def learn(self, cid, pos):
+        """Record a customer position; use this rather than writing knowledge directly.
+
+        cid may also be an array of ids with pos the matching (n, 2) positions.
+        """
+        # Re-learning what we already know is not a change
+        if self.knows[cid].all() and (self.knowledge_xy[cid] == pos).all():
+            return
+        self.knowledge_xy[cid] = pos
+        self.knows[cid] = True
+        self._knowledge_index = None
+        self._knowledge_version += 1
+        self._knowledge_dirty = True
 
     def share_knowledge(self):
-        """Share knowledge with other agents"""
-        # Reduce message cooldown if active
-        if self.message_cooldown > 0:
-            self.message_cooldown -= 1
-            
+        """Share knowledge with other agents.
+
+        Returns (version, knows) without copying; knows is the boolean mask of
+        customers we have positions for, the version changes whenever
+        knowledge does, and is None when nothing was transmitted. Receivers
+        must not modify the returned mask. Consensus ticks message_cooldown
+        for each transmission.
+        """
         # Battery low agents may not always be able to communicate reliably
-        if self.battery < 20 and random.random() < 0.3:
+        if self.battery < 20 and self._urand() < 0.3:
             # Battery too low to transmit reliable data
-            return {}
+            return None, np.zeros_like(self.knows)
             
-        return self.knowledge.copy()  # Return a copy to prevent inadvertent modifications
\ No newline at end of file
+        return self._knowledge_version, self.knows
+
+
+class AgentPool:
+    """Structure-of-arrays store for agent movement state.
+
+    Each field is one array with a row per agent; the Agent attributes of the
+    same names read and write their row, so agents keep their scalar API while
+    move_all updates the whole fleet with batched array operations.
+    """
+    FIELDS = {
+        "pos": (np.int16, 2),
+        "is_byzantine": (bool, None),
+        "step": (np.int32, None),
+        "direction": (np.int8, None),
+        "spiral_length": (np.int32, None),
+        "steps_in_current_direction": (np.int32, None),
+        "turns_taken": (np.int32, None),
+        "battery": (np.float32, None),
+        "battery_drain_rate": (np.float32, None),
+        "max_speed": (np.float32, None),
+        "current_speed": (np.float32, None),
+        "rotation": (np.float32, None),
+        "turning_rate": (np.float32, None),
+    }
+
+    def __init__(self, agents):
+        self.agents = list(agents)
+        n = len(self.agents)
+        for name, (dtype, width) in self.FIELDS.items():
+            setattr(self, name, np.zeros((n, width) if width else n, dtype=dtype))
+        self._rng = np.random.default_rng()
+
+        # Adopt the agents, carrying over state from any pool they were in
+        for row, agent in enumerate(self.agents):
+            old = getattr(agent, "_pool", None)
+            if old is not None:
+                for name in self.FIELDS:
+                    getattr(self, name)[row] = getattr(old, name)[agent._row]
+            agent._pool, agent._row = self, row
+
+    def move_all(self, env):
+        """Move every agent one step"""
+        self.move_rows(env, np.arange(len(self.agents)))
+
+    def move_rows(self, env, rows):
+        """Move the agents in the given rows one step"""
+        rows = np.asarray(rows, dtype=np.intp)
+        rng = self._rng
+
+        # Drain batteries (higher speed = more usage); depleted drones cannot move
+        speed_factor = self.current_speed[rows] / self.max_speed[rows]
+        drain = self.battery_drain_rate[rows] * speed_factor * (0.9 + 0.2 * rng.random(rows.size, dtype=np.float32))
+        self.battery[rows] = np.maximum(0, self.battery[rows] - drain)
+        rows = rows[self.battery[rows] > 0]
+
+        # Byzantine agents sometimes move erratically
+        erratic = self.is_byzantine[rows] & (rng.random(rows.size) < 0.1)
+        wild = rows[erratic]
+        if wild.size:
+            self.pos[wild, 0], self.pos[wild, 1] = random_step(
+                self.pos[wild, 0], self.pos[wild, 1], rng.integers(-1, 2, (wild.size, 2)), env.size)
+            self.step[wild] += 1
+        rows = rows[~erratic]
+
+        # Target-seeking toward the nearest known customer, spiral search otherwise
+        targets = {}
+        for row in rows.tolist():
+            agent = self.agents[row]
+            if not self.is_byzantine[row]:
+                cid = agent._nearest_known()
+                if cid is not None:
+                    targets[row] = agent.knowledge_xy[cid]
+        seekers = np.fromiter(targets, dtype=np.intp, count=len(targets))
+        searchers = rows[~np.isin(rows, seekers)]
+
+        if seekers.size:
+            tx, ty = np.array(list(targets.values()), dtype=np.float32).T
+            # Add small random movement occasionally to avoid getting stuck
+            jitter = (0.4 * rng.random((seekers.size, 2), dtype=np.float32) - 0.2) * (rng.random((seekers.size, 1)) < 0.1)
+            x, y, self.rotation[seekers] = toward_target_step(
+                self.pos[seekers, 0], self.pos[seekers, 1], tx, ty, self.rotation[seekers],
+                self.current_speed[seekers], self.turning_rate[seekers], env.size,
+                jitter[:, 0], jitter[:, 1])
+            self.pos[seekers, 0], self.pos[seekers, 1] = x, y
+
+        if searchers.size:
+            (x, y, self.direction[searchers], self.rotation[searchers],
+             self.steps_in_current_direction[searchers], self.spiral_length[searchers],
+             self.turns_taken[searchers]) = spiral_step(
+                self.pos[searchers, 0], self.pos[searchers, 1], self.direction[searchers],
+                self.rotation[searchers], self.steps_in_current_direction[searchers],
+                self.spiral_length[searchers], self.turns_taken[searchers],
+                self.turning_rate[searchers], env.size)
+            self.pos[searchers, 0], self.pos[searchers, 1] = x, y
+        self.step[rows] += 1
+
+        for row in rows.tolist():
+            agent = self.agents[row]
+            # Observe environment after moving
+            agent.observe(env)
+
+            # Keep track of position history (for visualization), oldest entries drop off
+            agent.last_positions.append(agent.pos)
@@ -0,0 +1,88 @@
+import numpy as np
+
+# Spiral search directions and their headings: right, down, left, up
+SPIRAL_DIRECTIONS = np.array([(0, 1), (1, 0), (0, -1), (-1, 0)])
+SPIRAL_ROTATIONS = np.array([0, 90, 180, 270], dtype=np.float32)
+
+# Unit heading vectors for the 24 headings of the 15 degree turning grid. Kept
+# in double precision: cos(270) is a tiny negative that truncation of the new
+# position depends on, float32 positions would round it away
+HEADING_STEP = 15
+_COS = np.cos(np.radians(np.arange(0, 360, HEADING_STEP)))
+_SIN = np.sin(np.radians(np.arange(0, 360, HEADING_STEP)))
+
+# All kernels operate on equal-length arrays, one element per agent, and
+# return new arrays rather than updating their arguments.
+
+
+def turn_toward(rotation, target_angle, turning_rate):
+    """Turn from rotation toward target_angle by at most turning_rate degrees"""
+    angle_diff = ((target_angle - rotation + 180) % 360) - 180
+    # Cannot turn instantly, turn gradually; close enough, set exactly
+    turned = (rotation + np.copysign(turning_rate, angle_diff)) % 360
+    return np.where(np.abs(angle_diff) > turning_rate, turned, target_angle)
+
+
+def random_step(pos_x, pos_y, deltas, env_size):
+    """Move by deltas, an (N, 2) array of -1/0/1 offsets. Returns (pos_x, pos_y)."""
+    return (np.clip(pos_x + deltas[:, 0], 0, env_size-1),
+            np.clip(pos_y + deltas[:, 1], 0, env_size-1))
+
+
+def spiral_step(pos_x, pos_y, direction, rotation, steps_in_dir, spiral_length, turns,
+                turning_rate, env_size):
+    """Advance one step of the outward spiral search.
+
+    Returns (pos_x, pos_y, direction, rotation, steps_in_dir, spiral_length, turns).
+    """
+    # Calculate new position in the current direction
+    new_x = np.clip(pos_x + SPIRAL_DIRECTIONS[direction, 0], 0, env_size-1)
+    new_y = np.clip(pos_y + SPIRAL_DIRECTIONS[direction, 1], 0, env_size-1)
+
+    # Gradually turn to the heading of the current direction
+    rotation = turn_toward(rotation, SPIRAL_ROTATIONS[direction], turning_rate)
+
+    # Hit a boundary: change direction and try again
+    blocked = (new_x == pos_x) & (new_y == pos_y)
+    direction = np.where(blocked, (direction + 1) % 4, direction)
+    new_x = np.where(blocked, np.clip(pos_x + SPIRAL_DIRECTIONS[direction, 0], 0, env_size-1), new_x)
+    new_y = np.where(blocked, np.clip(pos_y + SPIRAL_DIRECTIONS[direction, 1], 0, env_size-1), new_y)
+
+    # Turn at the end of each arm, lengthening the arm every 2 turns
+    steps_in_dir = steps_in_dir + 1
+    turn = steps_in_dir >= spiral_length
+    direction = np.where(turn, (direction + 1) % 4, direction)
+    steps_in_dir = np.where(turn, 0, steps_in_dir)
+    turns = turns + turn
+    spiral_length = spiral_length + (turn & (turns % 2 == 0))
+
+    return new_x, new_y, direction, rotation, steps_in_dir, spiral_length, turns
+
+
+def toward_target_step(pos_x, pos_y, tx, ty, rotation, speed, turning_rate, env_size,
+                       jitter_x=0.0, jitter_y=0.0):
+    """Turn toward (tx, ty) and move forward one step.
+
+    Returns (pos_x, pos_y, rotation).
+    """
+    # Calculate target angle
+    target_angle = np.degrees(np.arctan2(ty - pos_y, tx - pos_x))
+    target_angle = np.where(target_angle < 0, target_angle + 360, target_angle)
+    rotation = turn_toward(rotation, target_angle, turning_rate)
+
+    # Move forward in the current rotation direction, plus any jitter. Headings
+    # on the 15 degree grid come from the table, others (such as the exact
+    # angle to a target) are computed
+    idx = (rotation // HEADING_STEP).astype(int) % len(_COS)
+    cos, sin = _COS[idx], _SIN[idx]
+    off_grid = np.flatnonzero(rotation % HEADING_STEP != 0)
+    if off_grid.size:
+        rad = np.radians(rotation[off_grid].astype(np.float64))
+        cos[off_grid], sin[off_grid] = np.cos(rad), np.sin(rad)
+    move_dx = cos * speed + jitter_x
+    move_dy = sin * speed + jitter_y
+
+    # Update position within grid bounds (truncating like int())
+    new_x = np.clip(np.trunc(pos_x + move_dx), 0, env_size-1)
+    new_y = np.clip(np.trunc(pos_y + move_dy), 0, env_size-1)
+    return new_x, new_y, rotation
@@ -1,19 +1,75 @@
-from scipy.spatial import distance
+from scipy.spatial import cKDTree
 import numpy as np
 
 class Consensus:
     def __init__(self, agents):
         self.agents = agents
+        # (receiver, sender) -> (sender knowledge, vote, receiver knowledge) versions
+        # when the sender's report was last integrated
+        self._last_seen = {}
+        self._vote = None  # Consensus position per customer of the last vote, -1 where none agreed
+        self._vote_version = 0  # Bumped whenever the vote outcome changes
+        self._last_neighbors = None  # Neighbor lists of the last round that ran
+        self._failed_shares = False  # A transmission failed in that round and must be retried
 
     def update_knowledge(self):
-        for agent in self.agents:
-            shared = {}
-            for other in self.agents:
-                if distance.euclidean(agent.pos, other.pos) <= 5 and agent != other:
-                    shared.update(other.share_knowledge())
-            for cid in shared:
-                positions = [pos for a in self.agents for c, pos in a.knowledge.items() if c == cid]
-                if positions:
-                    avg_pos = np.mean(positions, axis=0)
-                    if len([p for p in positions if distance.euclidean(p, avg_pos) < 3]) >= len(self.agents) // 2:
-                        agent.knowledge[cid] = tuple(avg_pos.astype(int))
+        quorum = len(self.agents) // 2  # Agreeing reports needed to accept a position
+
+        # Communication neighborhoods (radius 5) from one tree per tick
+        pts = np.fromiter((a.pos for a in self.agents), dtype=(float, 2), count=len(self.agents))
+        tree = cKDTree(pts)
+        neighbors = tree.query_ball_point(pts, r=5.0, return_sorted=True).tolist()
+
+        # Message cooldowns tick once per neighbor an agent transmits to (ranges
+        # are symmetric, so that is everyone else in its own neighborhood).
+        # Counted here rather than in share_knowledge so skipped rounds count too
+        for a, in_range in zip(self.agents, neighbors):
+            if a.message_cooldown > 0:
+                a.message_cooldown = max(0, a.message_cooldown - (len(in_range) - 1))
+
+        # Nothing changed, nobody came into or left range and no transmission is
+        # waiting to be retried: the round would be a no-op
+        if (neighbors == self._last_neighbors and not self._failed_shares
+                and not any(a._knowledge_dirty for a in self.agents)):
+            return
+        self._last_neighbors = neighbors
+        # Clear before voting so positions adopted this round count as changes next round
+        for a in self.agents:
+            a._knowledge_dirty = False
+
+        # Vote on every customer once per round from all agents' reports:
+        # stack is (agents, customers, 2), mask marks the reports that exist
+        stack = np.stack([a.knowledge_xy for a in self.agents]).astype(np.float32)
+        mask = np.stack([a.knows for a in self.agents])
+        reports = mask.sum(axis=0)
+        avg_pos = (stack * mask[..., None]).sum(axis=0) / np.maximum(reports, 1)[:, None]
+        off = stack - avg_pos
+        close = ((off * off).sum(axis=2) < 9) & mask  # Within distance 3 of the mean
+        agreed = (reports > 0) & (close.sum(axis=0) >= quorum)
+        consensus_pos = avg_pos.astype(int)
+        vote = np.where(agreed[:, None], consensus_pos, -1)
+        if self._vote is None or not np.array_equal(vote, self._vote):
+            self._vote = vote
+            self._vote_version += 1
+
+        self._failed_shares = False
+        for i, agent in enumerate(self.agents):
+            shared = np.zeros_like(agent.knows)
+            heard = []  # (sender, version) of the reports integrated below
+            for j in neighbors[i]:
+                if j != i:
+                    version, knows = self.agents[j].share_knowledge()
+                    if version is None:
+                        self._failed_shares = True
+                        continue
+                    # Adopting the consensus for this report again would be a no-op when
+                    # the report, the vote and our own knowledge all stayed the same
+                    if self._last_seen.get((i, j)) == (version, self._vote_version, agent._knowledge_version):
+                        continue
+                    heard.append((j, version))
+                    shared |= knows
+            cids = np.flatnonzero(shared & agreed)
+            if cids.size:
+                agent.learn(cids, consensus_pos[cids])
+            for j, version in heard:
+                self._last_seen[(i, j)] = (version, self._vote_version, agent._knowledge_version)
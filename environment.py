@@ -4,14 +4,16 @@ class Environment:
     def __init__(self, size=20, num_customers=3):
         self.size = size
         self.grid = np.zeros((size, size), dtype=int)
-        self.customers = [(np.random.randint(0, size), np.random.randint(0, size)) 
-                         for _ in range(num_customers)]
-        self.step_count = 0
+        self._rng = np.random.default_rng()
+        # Customer positions as one (N, 2) array, row i is customer i
+        self.customers = self._rng.integers(0, size, size=(num_customers, 2), dtype=np.int16)
+        self.total_customers = num_customers  # Customers at creation, delivered or not
 
     def move_customers(self):
-        if self.step_count % 5 == 0:  # Move every 5 steps
-            for i, (x, y) in enumerate(self.customers):
-                dx, dy = np.random.choice([-1, 0, 1]), np.random.choice([-1, 0, 1])
-                new_x, new_y = max(0, min(self.size-1, x + dx)), max(0, min(self.size-1, y + dy))
-                self.customers[i] = (new_x, new_y)
-        self.step_count += 1
\ No newline at end of file
+        # Each customer steps to a random neighboring cell (or stays put)
+        deltas = self._rng.integers(-1, 2, size=self.customers.shape, dtype=np.int16)
+        np.clip(self.customers + deltas, 0, self.size-1, out=self.customers)
+
+    def remove_customer(self, index):
+        # index may be a row number, an array of rows or a boolean mask
+        self.customers = np.delete(self.customers, index, axis=0)
@@ -3,7 +3,7 @@ import time
 import random
 import math
 from environment import Environment
-from agent import Agent
+from agent import Agent, AgentPool
 from consensus import Consensus
 from metrics import competitive_ratio
 from visualize import visualize  # Import visualization module
@@ -15,6 +15,7 @@ def main():
     
     # Initialize pygame
     pygame.init()
+    clock = pygame.time.Clock()
     
     # Application state variables
     running = True             # Controls the entire application
@@ -32,10 +33,12 @@ def main():
             env = Environment(size=grid_size, num_customers=3)
             
         # Store initial customer count for metrics
-        initial_customer_count = len(env.customers)
+        initial_customer_count = env.total_customers
         
         # Create agents (Agent 0 is Byzantine)
-        agents = [Agent(i, (i*4, i*4), is_byzantine=(i == 0)) for i in range(5)]
+        agents = [Agent(i, (i*4, i*4), is_byzantine=(i == 0), num_customers=initial_customer_count)
+                  for i in range(5)]
+        pool = AgentPool(agents)
         consensus = Consensus(agents)
         
         # Create and initialize visualization
@@ -76,7 +79,7 @@ def main():
                 if step % 5 == 0:
                     env.move_customers()
                 
-                # Update agent positions
+                # Apply wind to agent positions
                 for agent in agents:
                     # Apply wind effects to agent movement (slight randomization)
                     if hasattr(viz, 'wind_direction') and hasattr(viz, 'wind_strength'):
@@ -87,21 +90,19 @@ def main():
                             
                             # Apply wind effect by adjusting agent position slightly
                             agent.apply_wind(wind_dx, wind_dy)
-                    
-                    # Move the agent
-                    agent.move(env)
+                
+                # Move all agents in one batched pass
+                pool.move_all(env)
                 
                 # Update consensus knowledge among agents
                 consensus.update_knowledge()
                 
-                # Check for deliveries
-                for agent in agents:
-                    for i, (cx, cy) in enumerate(env.customers[:]):  # Use a copy to safely modify
-                        if agent.pos == (cx, cy):
-                            # Remove delivered customer
-                            env.customers.pop(i)
-                            delivered_count += 1
-                            break
+                # Check for deliveries: customers sharing a cell with any agent
+                hits = (env.customers[None, :, :] == pool.pos[:, None, :]).all(axis=2).any(axis=0)
+                if hits.any():
+                    # Remove delivered customers
+                    env.remove_customer(hits)
+                    delivered_count += int(hits.sum())
                 
                 # Calculate current competitive ratio
                 current_ratio = competitive_ratio(agents, env)
@@ -140,9 +141,10 @@ def main():
                         text_rect = text.get_rect(center=(grid_size*20//2, grid_size*20//2))
                         pygame.display.get_surface().blit(text, text_rect)
                         pygame.display.flip()
+                        viz.mark_dirty(text_rect)  # Erase the message with the next frame
             
             # Control simulation speed
-            pygame.time.Clock().tick(10)  # 10 FPS
+            clock.tick(10)  # 10 FPS
     
     # Clean exit
     pygame.quit()
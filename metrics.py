@@ -1,12 +1,15 @@
-from scipy.spatial import distance
+import numpy as np
 
 def competitive_ratio(agents, env):
     total_steps = sum(agent.step for agent in agents)
-    
+
     # Handle case when there are no customers left
-    if not env.customers:
+    if len(env.customers) == 0:
         return total_steps  # Just return total steps when all customers are delivered
-    
+
     # Calculate minimum distance from each agent to any customer
-    optimal = sum(min(distance.euclidean(agent.pos, c) for c in env.customers) for agent in agents)
+    agent_pos = np.array([agent.pos for agent in agents], dtype=np.float32)
+    customer_pos = np.asarray(env.customers, dtype=np.float32)
+    offsets = agent_pos[:, None, :] - customer_pos[None, :, :]
+    optimal = float(np.sqrt((offsets * offsets).sum(axis=2).min(axis=1)).sum())
     return total_steps / optimal if optimal > 0 else float('inf')
@@ -3,10 +3,136 @@ import math
 import os
 import time
 import random
+import numpy as np
+from collections import deque
 
 # Initialize pygame
 pygame.init()
 
+# Positions kept per drone for its flight path trail
+PATH_LENGTH = 30
+
+# Background color of sprites that need fully transparent pixels but no blending;
+# these are kept as RGB surfaces with a color key instead of per-pixel alpha
+TRANSPARENT_KEY = (255, 0, 255)
+
+# Static city features are also kept as structured arrays, one record per feature,
+# with the type names stored as indices into these lists
+BUILDING_TYPES = ["residential", "commercial", "industrial"]
+OBSTACLE_TYPES = ["tree", "pole", "antenna"]
+BUILDING_DTYPE = np.dtype([("x", "i2"), ("y", "i2"), ("size", "i1"), ("type", "i1"), ("template", "i1")])
+OBSTACLE_DTYPE = np.dtype([("x", "i2"), ("y", "i2"), ("type", "i1")])
+
+# Uniform samples drawn per frame for random visual effects
+RAND_POOL_SIZE = 256
+
+# Path segments sharing an alpha bucket and width are drawn as one polyline
+PATH_ALPHA_BUCKETS = 8
+
+# Distinct building sprites generated; each building uses one picked by its position
+BUILDING_TEMPLATES = 16
+
+# Efficiency ratings shown in the results panel, from worst to best
+RATINGS = ["Poor", "Fair", "Good", "Excellent"]
+RATING_LABEL = "Rating: {}"
+# Mission outcomes shown in the results panel, from worst to best
+MISSION_STATUSES = ["MISSION NEEDS IMPROVEMENT", "MISSION PARTIAL SUCCESS", "MISSION SUCCESSFUL"]
+# Column header of the results panel history table; show_results formats rows to match
+HISTORY_HEADER = f"{'#':3} {'Time':10} {'Duration':10} {'Efficiency':12} {'Deliveries':12} {'Rating':10}"
+# Distance of the results panel buttons' top edge from the panel bottom
+RESULTS_BUTTON_OFFSET = 70
+
+# Most effects of each kind kept alive at once; starting another drops the oldest
+MAX_ANIMATIONS = 64
+
+# Sprite layers: drones are drawn above customers
+CUSTOMER_LAYER = 0
+DRONE_LAYER = 1
+
+# Resolution of the sun and moon position table (one entry per 3 minutes)
+CELESTIAL_STEPS_PER_HOUR = 20
+
+# Battery indicator fill levels rendered (one per 5%)
+BATTERY_BUCKETS = 20
+# Levels at which the battery indicator turns from low to medium to good
+BATTERY_THRESHOLDS = [0.3, 0.6]
+
+def _celestial_positions(hours, window_size):
+    """Screen (x, y) of the sun (6:00-18:00) or else the moon for each time of day"""
+    hours = np.asarray(hours, dtype=np.float64)
+    # 0-1 from dawn to dusk for the sun, from dusk to dawn for the moon
+    progress = np.where((hours >= 6) & (hours < 18), (hours - 6) / 12,
+                        np.where(hours >= 18, (hours - 18) / 12, (hours + 6) / 12))
+    x = (progress * window_size).astype(np.int32)
+    y = (100 + np.sin(np.pi * progress) * -200).astype(np.int32)
+    return np.stack([x, y], axis=1)
+
+def _path_segments(path, cell_size):
+    """Screen points for a path of (row, col) cells, at the center of each cell"""
+    return path[:, ::-1].astype(np.int32) * cell_size + cell_size // 2
+
+def _keyed_surface(size):
+    """Opaque surface filled with TRANSPARENT_KEY, for sprites with no partial transparency"""
+    surface = pygame.Surface(size)
+    surface.fill(TRANSPARENT_KEY)
+    return surface
+
+def _convert_keyed(surface):
+    """Convert a _keyed_surface to the display format with its fill color keyed out"""
+    surface = surface.convert()
+    surface.set_colorkey(TRANSPARENT_KEY, pygame.RLEACCEL)
+    return surface
+
+def _compute_anim_geom(time, frames, row, col, cell_size):
+    """Size and top-left screen corner of each delivery effect, shrinking as it runs out.
+
+    Returns (sizes, xs, ys) int32 arrays; the effect is centered on its cell.
+    """
+    scale = 1.0 - (frames - time) / frames
+    sizes = (cell_size * 2 * scale).astype(np.int32)
+    xs = col * cell_size + cell_size // 2 - sizes // 2
+    ys = row * cell_size + cell_size // 2 - sizes // 2
+    return sizes, xs, ys
+
+class _AnimationPool:
+    """Structure-of-arrays store for one kind of timed map animation.
+
+    Row i of time, frames, row and col is the i-th live animation, oldest
+    first; only the first len(self) rows are in use.
+    """
+    def __init__(self, capacity=MAX_ANIMATIONS):
+        self.time = np.zeros(capacity, dtype=np.int32)  # Frames left
+        self.frames = np.ones(capacity, dtype=np.int32)  # Total length
+        self.row = np.zeros(capacity, dtype=np.int32)  # Grid position
+        self.col = np.zeros(capacity, dtype=np.int32)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, pos, frames):
+        """Start an animation at grid position pos; when full, the oldest is dropped"""
+        if self.count == len(self.time):
+            for field in (self.time, self.frames, self.row, self.col):
+                field[:-1] = field[1:]
+            self.count -= 1
+        i = self.count
+        self.time[i] = self.frames[i] = frames
+        self.row[i], self.col[i] = pos
+        self.count += 1
+
+    def tick(self):
+        """Advance every animation one frame and drop those that finished"""
+        n = self.count
+        self.time[:n] -= 1
+        alive = self.time[:n] > 0
+        self.count = int(alive.sum())
+        for field in (self.time, self.frames, self.row, self.col):
+            field[:self.count] = field[:n][alive]
+
+    def clear(self):
+        self.count = 0
+
 class RealisticVisualizer:
     def __init__(self, size=20, window_size=800):
         self.grid_size = size
@@ -37,22 +163,61 @@ class RealisticVisualizer:
         self.header_font = pygame.font.SysFont('Arial', 18, bold=True)
         self.info_font = pygame.font.SysFont('Arial', 16)
         self.small_font = pygame.font.SysFont('Arial', 12)
+        self.mono_font = pygame.font.SysFont('Courier New, DejaVu Sans Mono, monospace', 12)  # Aligned table columns
         
         # Prepare the screen
         self.screen = pygame.display.set_mode((window_size, window_size + 150))  # Extra 150px for dashboard
         pygame.display.set_caption("Drone Delivery Management System")
         
         # Track animation effects
-        self.delivery_animations = []  # List of active delivery animations
-        self.communication_signals = []  # List of active communication signals
-        self.weather_effects = []  # Wind, rain, etc.
-        self.drone_paths = {}  # Store drone paths for visualization
+        self.delivery_animations = _AnimationPool()  # Active delivery animations
+        self.communication_signals = _AnimationPool()  # Active communication signals
+        self.weather_effects = deque(maxlen=MAX_ANIMATIONS)  # Wind, rain, etc.
+        self._reset_paths()  # Drone path ring buffers for visualization
+        
+        # Segment alpha and width by (path length, segment index), newer segments are
+        # more opaque and thicker
+        n = np.arange(PATH_LENGTH + 1)[:, None]
+        i = np.arange(PATH_LENGTH)[None, :]
+        self._path_alpha = np.minimum(255, 180 * (i + 1) // np.maximum(n, 1))
+        self._path_width = np.maximum(1, 3 - (n - i) // 5)
+        self._path_runs = [self._segment_runs(length) for length in range(PATH_LENGTH + 1)]
+        
+        # Uniform samples for per-frame random effects, batch drawn each frame
+        self._rng = np.random.default_rng()
+        self._refill_rand_pool()
+        
+        # Sprites rendered once and reused every frame
+        self._shadow_surface = self._render_shadow()
+        self._battery_sprites = {}  # (fill bucket, palette index) -> battery indicator
+        self._battery_palette = [self.colors["battery_low"], self.colors["battery_med"],
+                                 self.colors["battery_good"]]
+        self._label_cache = {}  # (text, color) -> small font label, see _label
+        self._delivered_text = self.info_font.render("Delivered!", True, (255, 255, 255)).convert_alpha()
+        self._prerender_static_text()
+        self._dashboard_text = {}  # Dashboard field -> (value, rendered text), see _dashboard_value
+        
+        # Animation frames, shared by every live animation at the same stage
+        self._scaled_effect_cache = {}  # Size -> scaled delivery effect
+        self._signal_rings = {}  # Animation length -> ring per remaining frame, see _signal_ring_frames
+        for frames in (15, 20):  # Drone signals and the default length
+            self._signal_ring_frames(frames)
+        
+        # Drones and customers are sprites in one layered group, with their
+        # composed images cached by state
+        self._sprites = pygame.sprite.LayeredUpdates()
+        self._drone_sprites = {}  # Agent id -> sprite
+        self._customer_sprites = []  # Sprite per remaining customer, in order
+        self._drone_images = {}  # (byzantine, id, battery bucket, palette index) -> image
+        self._customer_images = {}  # (customer index, waving) -> image
         
         # Create pygame Clock for controlling FPS
         self.clock = pygame.time.Clock()
         
         # Results panel elements
         self.simulation_history = []
+        self._results_panel_surface = None  # Rendered results panel, see draw_results_panel
+        self._results_panel_dirty = True  # History changed since the panel was rendered
         self.show_results_panel = False
         self.run_button_rect = pygame.Rect(0, 0, 0, 0)
         self.close_button_rect = pygame.Rect(0, 0, 0, 0)
@@ -61,23 +226,45 @@ class RealisticVisualizer:
         self.wind_direction = random.randint(0, 359)  # Wind direction in degrees
         self.wind_strength = random.uniform(0, 0.3)   # Wind strength (0-1)
         self.wind_update_timer = 0
+        self._update_wind_geometry()
         
         # Time of day simulation
         self.time_of_day = 0  # 0-23 hours
-        self.day_cycle_speed = 0.05  # How quickly time passes (hours per step)
+        self.day_cycle_speed = 0.1  # How quickly time passes (hours per frame)
+        self._sky_lut = [self._sky_color(t / 10.0) for t in range(240)]  # Per 0.1 hour
+        self._stars_surface = self._render_stars()
+        self._celestial_lut = _celestial_positions(
+            np.arange(24 * CELESTIAL_STEPS_PER_HOUR) / CELESTIAL_STEPS_PER_HOUR, window_size).tolist()
         
         # Load or create assets
         self.images = self._prepare_assets()
         
         # Generate environment (roads, buildings, obstacles)
         self.environment = self._generate_environment()
+        self._env_surface = self._render_environment()
+        
+        # Sky plus static city layer and dashboard chrome, redrawn only when the sky changes; between
+        # rebuilds frames only restore and present the rectangles that changed
+        self._bg_surface = pygame.Surface((window_size, window_size + 150)).convert()
+        self._bg_dirty = True  # Background must be rebuilt before the next frame
+        self._bg_time_bucket = None  # Half hour of the day the background shows
+        self._full_redraw = True  # Next frame repaints and presents the whole window
+        # Dashboard area, including the separator line, repainted every frame
+        self._dashboard_rect = pygame.Rect(0, window_size - 1, window_size, 151)
+        self._dashboard_changed = True  # Dashboard differs from what was last presented
+        self._prev_rects = []  # Map areas drawn over last frame
+        self._frame_rects = []  # Map areas drawn over this frame
         
         # Create a camera object for map panning/zooming (future enhancement)
         self.camera_offset = [0, 0]
         self.zoom = 1.0
 
     def _prepare_assets(self):
-        """Create or load visual assets for the simulation"""
+        """Create or load visual assets for the simulation.
+
+        Must run after the display mode is set: every sprite is converted to the
+        display's pixel format so blits take SDL's fast path.
+        """
         images = {}
         
         # Create drone surface with propellers
@@ -114,12 +301,12 @@ class RealisticVisualizer:
                     pygame.draw.circle(drone_surface, (30, 30, 30), 
                                      (damage_x, damage_y), damage_size)
             
-            return drone_surface
+            return drone_surface.convert_alpha()
         
         # Create building with windows
         def create_building(size, windows=True):
             """Create a building with optional windows"""
-            building = pygame.Surface((size, size), pygame.SRCALPHA)
+            building = _keyed_surface((size, size))
             
             # Main building structure
             building_color = (random.randint(180, 220), 
@@ -144,7 +331,7 @@ class RealisticVisualizer:
                             pygame.draw.rect(building, window_color, 
                                           (x, y, window_size, window_size))
             
-            return building
+            return _convert_keyed(building)
         
         # Create package sprite
         def create_package(size):
@@ -158,7 +345,7 @@ class RealisticVisualizer:
             pygame.draw.rect(package, (168, 86, 27), (0, size//3, size, size//4))
             pygame.draw.line(package, (70, 40, 10), (size//2, 0), (size//2, size), 1)
             
-            return package
+            return package.convert_alpha()
             
         # Create delivery animation
         def create_delivery_effect(size):
@@ -179,7 +366,7 @@ class RealisticVisualizer:
             pygame.draw.lines(effect, (255, 255, 255, 200), False, 
                            [(size*0.6, size), (size*0.8, size*1.2), (size*1.4, size*0.6)], 4)
             
-            return effect
+            return effect.convert_alpha()
         
         # Create signal/communication visual
         def create_signal_wave(size):
@@ -192,16 +379,43 @@ class RealisticVisualizer:
                 pygame.draw.circle(signal, (255, 255, 255, alpha), 
                                  (size*2, size*2), radius, 1)
             
-            return signal
+            return signal.convert_alpha()
+            
+        # Create waiting customer (stick figure), drawn around the cell center
+        def create_person(size, waving=False):
+            """Create a stick figure sprite covering one cell"""
+            person = pygame.Surface((size, size), pygame.SRCALPHA)
+            color = (200, 150, 150)
+            x, y = size // 2, size // 2
             
+            pygame.draw.circle(person, color, (x, y + size // 8), 3)  # Head
+            pygame.draw.line(person, color, (x, y + size // 8 + 3), (x, y + size // 4), 2)  # Body
+            if waving:
+                pygame.draw.line(person, color, (x, y + size // 8 + 5), (x + 5, y + size // 8 - 2), 2)  # Arm up
+            else:
+                pygame.draw.line(person, color, (x, y + size // 8 + 5), (x + 5, y + size // 8 + 5), 2)  # Arm
+            
+            return person.convert_alpha()
+        
         # Load all assets
         images["normal_drone"] = create_drone(self.colors["normal_drone"], self.cell_size)
         images["byzantine_drone"] = create_drone(self.colors["byzantine_drone"], 
                                                 self.cell_size, is_damaged=True)
-        images["building"] = create_building(self.cell_size - 4)
+        images["building_templates"] = [create_building(self.cell_size - 4)
+                                        for _ in range(BUILDING_TEMPLATES)]
+        images["building"] = images["building_templates"][0]
+        # Buildings span 1 or 2 cells; scale every template once for each footprint
+        images["building_scaled"] = {
+            s: [_convert_keyed(pygame.transform.scale(template,
+                                                      (self.cell_size * s - 4, self.cell_size * s - 4)))
+                for template in images["building_templates"]]
+            for s in (1, 2)
+        }
         images["package"] = create_package(self.cell_size // 2)
         images["delivery_effect"] = create_delivery_effect(self.cell_size)
         images["signal_wave"] = create_signal_wave(self.cell_size)
+        images["person_idle"] = create_person(self.cell_size)
+        images["person_waving"] = create_person(self.cell_size, waving=True)
         
         # Create propeller animation frames (for future enhancement)
         images["propeller_frames"] = []
@@ -214,7 +428,7 @@ class RealisticVisualizer:
             x2 = center[0] - math.cos(rad) * (self.cell_size//16)
             y2 = center[1] - math.sin(rad) * (self.cell_size//16)
             pygame.draw.line(prop, (200, 200, 200), (x1, y1), (x2, y2), 2)
-            images["propeller_frames"].append(prop)
+            images["propeller_frames"].append(prop.convert_alpha())
             
         return images
 
@@ -257,55 +471,100 @@ class RealisticVisualizer:
                         building = {
                             "pos": (building_x, building_y),
                             "size": random.choice([1, 1, 2]),  # Most buildings are size 1, some are 2
-                            "type": random.choice(["residential", "commercial", "industrial"])
+                            "type": random.choice(BUILDING_TYPES),
+                            "template_idx": hash((building_x, building_y)) % BUILDING_TEMPLATES
                         }
                         environment["buildings"].append(building)
         
+        environment["buildings_sa"] = np.array(
+            [(*b["pos"], b["size"], BUILDING_TYPES.index(b["type"]), b["template_idx"])
+             for b in environment["buildings"]],
+            dtype=BUILDING_DTYPE)
+        
         # Add some random obstacles (trees, power lines, etc.)
+        # Cells taken by roads (the rows and columns of their end points) or buildings
+        occupied = np.zeros((self.grid_size, self.grid_size), dtype=bool)
+        for road in environment["roads"]:
+            occupied[[road["start"][0], road["end"][0]], :] = True
+            occupied[:, [road["start"][1], road["end"][1]]] = True
+        for bx, by, size, _, _ in environment["buildings_sa"].tolist():
+            occupied[max(0, bx - size + 1):bx + size, max(0, by - size + 1):by + size] = True
         for _ in range(self.grid_size // 2):
             obstacle_x = random.randint(0, self.grid_size-1)
             obstacle_y = random.randint(0, self.grid_size-1)
             
             # Don't place obstacles on roads or buildings
-            is_on_road = any(
-                (obstacle_x == road["start"][0] or obstacle_x == road["end"][0] or 
-                obstacle_y == road["start"][1] or obstacle_y == road["end"][1])
-                for road in environment["roads"]
-            )
-            
-            is_on_building = any(
-                (abs(obstacle_x - building["pos"][0]) < building["size"] and 
-                abs(obstacle_y - building["pos"][1]) < building["size"])
-                for building in environment["buildings"]
-            )
-            
-            if not is_on_road and not is_on_building:
+            if not occupied[obstacle_x, obstacle_y]:
                 obstacle = {
                     "pos": (obstacle_x, obstacle_y),
-                    "type": random.choice(["tree", "pole", "antenna"])
+                    "type": random.choice(OBSTACLE_TYPES)
                 }
                 environment["obstacles"].append(obstacle)
+        environment["obstacles_sa"] = np.array(
+            [(*o["pos"], OBSTACLE_TYPES.index(o["type"])) for o in environment["obstacles"]],
+            dtype=OBSTACLE_DTYPE)
         
         return environment
 
     def _draw_environment(self):
         """Draw the realistic city environment"""
-        # Fill the sky background based on time of day
-        self._draw_sky()
+        if self._bg_dirty or self._time_bucket_changed():
+            self._rebuild_background()
         
+        if self._full_redraw:
+            self.screen.blit(self._bg_surface, (0, 0))
+        else:
+            # Erase last frame's moving elements
+            for rect in self._prev_rects:
+                self.screen.blit(self._bg_surface, rect, rect)
+
+    def _time_bucket_changed(self):
+        """Whether the time of day has moved into another half hour since the last rebuild"""
+        return int(self.time_of_day * 2) != self._bg_time_bucket
+
+    def _rebuild_background(self):
+        """Redraw the sky, the static city layer and the dashboard chrome into the background surface"""
+        # The sky based on time of day, then roads, buildings and obstacles, which
+        # never change during a simulation
+        self._draw_sky(self._bg_surface)
+        self._bg_surface.blit(self._env_surface, (0, 0))
+        self._draw_dashboard_chrome(self._bg_surface)
+        self._bg_time_bucket = int(self.time_of_day * 2)
+        self._bg_dirty = False
+        self._full_redraw = True
+
+    def mark_dirty(self, rect=None):
+        """Note that something outside the visualizer drew over the window.
+
+        The given area, or the whole window when rect is None, is repainted and
+        presented on the next frame.
+        """
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._prev_rects.append(pygame.Rect(rect))
+
+    def _render_environment(self):
+        """Render the static city layer once into a color keyed surface"""
+        surface = _keyed_surface((self.window_size, self.window_size))
+        self._render_environment_to(surface)
+        return _convert_keyed(surface)
+
+    def _render_environment_to(self, surface):
+        """Draw roads, buildings and obstacles onto the given surface"""
         # Draw roads
         for road in self.environment["roads"]:
             start_x, start_y = road["start"]
             end_x, end_y = road["end"]
             
             if start_x == end_x:  # Vertical road
-                pygame.draw.rect(self.screen, self.colors["roads"],
+                pygame.draw.rect(surface, self.colors["roads"],
                               (start_x * self.cell_size - road["width"]/2, 
                                start_y * self.cell_size,
                                self.cell_size * road["width"], 
                                (end_y - start_y + 1) * self.cell_size))
             else:  # Horizontal road
-                pygame.draw.rect(self.screen, self.colors["roads"],
+                pygame.draw.rect(surface, self.colors["roads"],
                               (start_x * self.cell_size, 
                                start_y * self.cell_size - road["width"]/2,
                                (end_x - start_x + 1) * self.cell_size, 
@@ -314,68 +573,62 @@ class RealisticVisualizer:
             # Add road markings
             if start_x == end_x:  # Vertical road
                 for y in range(start_y, end_y+1, 2):
-                    pygame.draw.rect(self.screen, (255, 255, 255),
+                    pygame.draw.rect(surface, (255, 255, 255),
                                   (start_x * self.cell_size, 
                                    y * self.cell_size + self.cell_size//2,
                                    self.cell_size//8, self.cell_size//4))
             else:  # Horizontal road
                 for x in range(start_x, end_x+1, 2):
-                    pygame.draw.rect(self.screen, (255, 255, 255),
+                    pygame.draw.rect(surface, (255, 255, 255),
                                   (x * self.cell_size + self.cell_size//2, 
                                    start_y * self.cell_size,
                                    self.cell_size//4, self.cell_size//8))
         
         # Draw buildings
-        for building in self.environment["buildings"]:
-            pos_x, pos_y = building["pos"]
-            size = building["size"]
-            building_img = pygame.transform.scale(
-                self.images["building"], 
-                (self.cell_size * size - 4, self.cell_size * size - 4)
-            )
-            self.screen.blit(building_img, 
-                           (pos_y * self.cell_size + 2, pos_x * self.cell_size + 2))
+        for pos_x, pos_y, size, _, template_idx in self.environment["buildings_sa"].tolist():
+            building_img = self.images["building_scaled"][size][template_idx]
+            surface.blit(building_img, 
+                         (pos_y * self.cell_size + 2, pos_x * self.cell_size + 2))
         
         # Draw obstacles
-        for obstacle in self.environment["obstacles"]:
-            pos_x, pos_y = obstacle["pos"]
-            obstacle_type = obstacle["type"]
+        for pos_x, pos_y, type_id in self.environment["obstacles_sa"].tolist():
+            obstacle_type = OBSTACLE_TYPES[type_id]
             
             if obstacle_type == "tree":
                 # Draw tree trunk
-                pygame.draw.rect(self.screen, (101, 67, 33),  # Brown
+                pygame.draw.rect(surface, (101, 67, 33),  # Brown
                               (pos_y * self.cell_size + self.cell_size//2 - 2,
                                pos_x * self.cell_size + self.cell_size//2,
                                4, self.cell_size//2))
                 
                 # Draw tree top (circle)
-                pygame.draw.circle(self.screen, (0, 100, 0),  # Dark green
+                pygame.draw.circle(surface, (0, 100, 0),  # Dark green
                                  (pos_y * self.cell_size + self.cell_size//2,
                                   pos_x * self.cell_size + self.cell_size//3),
                                  self.cell_size//3)
             
             elif obstacle_type == "pole":
                 # Power/telephone pole
-                pygame.draw.rect(self.screen, (90, 90, 90),  # Dark gray
+                pygame.draw.rect(surface, (90, 90, 90),  # Dark gray
                               (pos_y * self.cell_size + self.cell_size//2 - 2,
                                pos_x * self.cell_size + self.cell_size//4,
                                4, self.cell_size//2))
                 
                 # Crossbar
-                pygame.draw.rect(self.screen, (60, 60, 60),  # Darker gray
+                pygame.draw.rect(surface, (60, 60, 60),  # Darker gray
                               (pos_y * self.cell_size + self.cell_size//4,
                                pos_x * self.cell_size + self.cell_size//3,
                                self.cell_size//2, 3))
                 
             elif obstacle_type == "antenna":
                 # Base
-                pygame.draw.rect(self.screen, (150, 150, 150),  # Light gray
+                pygame.draw.rect(surface, (150, 150, 150),  # Light gray
                               (pos_y * self.cell_size + self.cell_size//2 - 2,
                                pos_x * self.cell_size + self.cell_size//4,
                                4, self.cell_size//2))
                 
                 # Antenna parts
-                pygame.draw.lines(self.screen, (100, 100, 100), False,
+                pygame.draw.lines(surface, (100, 100, 100), False,
                                [(pos_y * self.cell_size + self.cell_size//2,
                                  pos_x * self.cell_size + self.cell_size//4),
                                 (pos_y * self.cell_size + self.cell_size//2,
@@ -383,7 +636,7 @@ class RealisticVisualizer:
                                 (pos_y * self.cell_size + self.cell_size//2 + self.cell_size//4,
                                  pos_x * self.cell_size + self.cell_size//8)], 2)
                 
-                pygame.draw.lines(self.screen, (100, 100, 100), False,
+                pygame.draw.lines(surface, (100, 100, 100), False,
                                [(pos_y * self.cell_size + self.cell_size//2,
                                  pos_x * self.cell_size + self.cell_size//4),
                                 (pos_y * self.cell_size + self.cell_size//2,
@@ -391,280 +644,347 @@ class RealisticVisualizer:
                                 (pos_y * self.cell_size + self.cell_size//2 - self.cell_size//4,
                                  pos_x * self.cell_size + self.cell_size//8)], 2)
 
-    def _draw_sky(self):
-        """Draw sky with time-of-day effects"""
-        # Calculate sky color based on time of day (0-23 hours)
-        if 6 <= self.time_of_day < 18:
+    @staticmethod
+    def _sky_color(time_of_day):
+        """Sky color for a time of day (0-24 hours)"""
+        if 6 <= time_of_day < 18:
             # Daytime - blue sky
-            day_progress = abs(self.time_of_day - 12) / 6  # 0 at noon, 1 at 6am/6pm
+            day_progress = abs(time_of_day - 12) / 6  # 0 at noon, 1 at 6am/6pm
             
             # Lighter blue at midday, darker at dawn/dusk
             r = int(135 - day_progress * 30)
             g = int(206 - day_progress * 40)
             b = int(235 - day_progress * 30)
-            sky_color = (r, g, b)
         else:
             # Night time - dark blue to black
-            night_progress = min(abs(self.time_of_day - 0), abs(self.time_of_day - 24)) / 6
+            night_progress = min(abs(time_of_day - 0), abs(time_of_day - 24)) / 6
             # Darkest at midnight, lighten toward dawn/dusk
             r = int(25 + night_progress * 30)
             g = int(25 + night_progress * 40)
             b = int(50 + night_progress * 50)
-            sky_color = (r, g, b)
+        return (r, g, b)
+
+    def _render_stars(self, count=50):
+        """Render a fixed field of night stars into a color keyed surface"""
+        stars = _keyed_surface((self.window_size, self.window_size // 2))
+        for _ in range(count):
+            star_x = random.randint(0, self.window_size)
+            star_y = random.randint(0, self.window_size // 2)
+            brightness = random.randint(150, 255)
+            # Some stars are brighter
+            radius = 2 if random.random() < 0.1 else 1
+            pygame.draw.circle(stars, (brightness, brightness, brightness), (star_x, star_y), radius)
+        return _convert_keyed(stars)
+
+    def _draw_sky(self, surface):
+        """Draw sky with time-of-day effects onto surface"""
+        # Sky color for the current tenth of an hour
+        sky_color = self._sky_lut[int(self.time_of_day * 10) % len(self._sky_lut)]
             
         # Fill background with sky color
-        self.screen.fill(sky_color)
+        surface.fill(sky_color)
         
-        # Add sun or moon
+        # Add sun or moon (moves across the sky)
+        body_x, body_y = self._celestial_lut[int(self.time_of_day * CELESTIAL_STEPS_PER_HOUR)
+                                             % len(self._celestial_lut)]
         if 6 <= self.time_of_day < 18:
-            # Sun position (moves across the sky)
-            sun_progress = (self.time_of_day - 6) / 12  # 0-1 from dawn to dusk
-            sun_x = int(sun_progress * self.window_size)
-            sun_y = int(100 + math.sin(math.pi * sun_progress) * -200)
-            
             # Draw sun
-            pygame.draw.circle(self.screen, (255, 255, 190), (sun_x, sun_y), 30)
+            pygame.draw.circle(surface, (255, 255, 190), (body_x, body_y), 30)
             # Add glow
             for r in range(35, 55, 5):
-                pygame.draw.circle(self.screen, (255, 255, 190, 50), (sun_x, sun_y), r)
+                pygame.draw.circle(surface, (255, 255, 190, 50), (body_x, body_y), r)
         else:
-            # Moon position
-            moon_progress = (self.time_of_day - 18) / 12 if self.time_of_day >= 18 else (self.time_of_day + 6) / 12
-            moon_x = int(moon_progress * self.window_size)
-            moon_y = int(100 + math.sin(math.pi * moon_progress) * -200)
-            
             # Draw moon
-            pygame.draw.circle(self.screen, (230, 230, 230), (moon_x, moon_y), 20)
-            
-            # Add a few stars at night
-            for _ in range(50):
-                star_x = random.randint(0, self.window_size)
-                star_y = random.randint(0, self.window_size // 2)
-                brightness = random.randint(150, 255)
-                # Twinkle effect - some stars are brighter
-                if random.random() < 0.1:
-                    pygame.draw.circle(self.screen, (brightness, brightness, brightness), (star_x, star_y), 2)
-                else:
-                    pygame.draw.circle(self.screen, (brightness, brightness, brightness), (star_x, star_y), 1)
-        
-        # Update time of day for next frame
-        self.time_of_day = (self.time_of_day + self.day_cycle_speed) % 24
+            pygame.draw.circle(surface, (230, 230, 230), (body_x, body_y), 20)
+            
+            # Add the pre-rendered stars, twinkling slowly
+            self._stars_surface.set_alpha(205 + int(50 * math.sin(self.time_of_day * 8)))
+            surface.blit(self._stars_surface, (0, 0))
+
+    def _reset_paths(self, max_agents=0):
+        """Clear the path ring buffers, sized for agent ids below max_agents"""
+        self._paths = np.zeros((max_agents, PATH_LENGTH, 2), dtype=np.int16)
+        self._path_head = np.zeros(max_agents, dtype=np.intp)  # Next slot to write
+        self._path_count = np.zeros(max_agents, dtype=np.intp)  # Positions stored
+
+    def _record_path(self, agent):
+        """Append the agent's position to its path if it moved"""
+        aid = agent.id
+        if aid >= len(self._paths):
+            # Grow the buffers to fit a new agent id
+            paths, head, count = self._paths, self._path_head, self._path_count
+            self._reset_paths(aid + 1)
+            self._paths[:len(paths)] = paths
+            self._path_head[:len(head)] = head
+            self._path_count[:len(count)] = count
+        
+        head = self._path_head[aid]
+        pos = agent.pos
+        if self._path_count[aid] and tuple(self._paths[aid, head - 1]) == pos:
+            return
+        # Only add new positions; the oldest entry is overwritten once full
+        self._paths[aid, head] = pos
+        self._path_head[aid] = (head + 1) % PATH_LENGTH
+        self._path_count[aid] = min(self._path_count[aid] + 1, PATH_LENGTH)
+
+    def _path_points(self, aid):
+        """Stored path of an agent, oldest first, as an (n, 2) array"""
+        if aid >= len(self._paths):
+            return self._paths[:0, 0]
+        n = self._path_count[aid]
+        return self._paths[aid, (self._path_head[aid] - n + np.arange(n)) % PATH_LENGTH]
+
+    def _segment_runs(self, n):
+        """Group the segments of an n-point path into runs of equal alpha bucket and width.
+
+        Returns (first segment, last segment, alpha, width) tuples, oldest first.
+        """
+        runs = []
+        bucket_size = 256 // PATH_ALPHA_BUCKETS
+        for i in range(n - 1):
+            bucket = int(self._path_alpha[n, i]) // bucket_size
+            width = int(self._path_width[n, i])
+            if runs and runs[-1][2] == bucket and runs[-1][3] == width:
+                runs[-1][1] = i
+            else:
+                runs.append([i, i, bucket, width])
+        return [(first, last, min(255, bucket * bucket_size + bucket_size // 2), width)
+                for first, last, bucket, width in runs]
 
     def _draw_drone_paths(self, agents):
         """Draw drone flight paths with realistic effects"""
         for agent in agents:
-            if agent.id in self.drone_paths:
-                path = self.drone_paths[agent.id]
-                if len(path) > 1:
-                    # Set path color based on agent type
-                    path_color = self.colors["byzantine_drone"] if agent.is_byzantine else self.colors["normal_drone"]
-                    
-                    # Draw with decreasing alpha for older segments
-                    for i in range(len(path) - 1):
-                        # Calculate alpha based on segment age
-                        alpha = min(255, int(180 * (i + 1) / len(path)))
-                        
-                        # Draw line segment
-                        pygame.draw.line(
-                            self.screen,
-                            (*path_color[:3], alpha),
-                            (path[i][1] * self.cell_size + self.cell_size // 2, 
-                             path[i][0] * self.cell_size + self.cell_size // 2),
-                            (path[i+1][1] * self.cell_size + self.cell_size // 2, 
-                             path[i+1][0] * self.cell_size + self.cell_size // 2),
-                            max(1, 3 - (len(path) - i) // 5)  # Thicker for newer segments
-                        )
+            path = self._path_points(agent.id)
+            if len(path) > 1:
+                # Set path color based on agent type
+                path_color = self.colors["byzantine_drone"] if agent.is_byzantine else self.colors["normal_drone"]
+                
+                # Screen coordinates of the segment end points
+                points = _path_segments(path, self.cell_size).tolist()
+                
+                # Draw with decreasing alpha and width for older segments, one polyline per run
+                for first, last, alpha, width in self._path_runs[len(path)]:
+                    self._frame_rects.append(pygame.draw.lines(
+                        self.screen, (*path_color[:3], alpha), False, points[first:last + 2], width))
 
-    def _draw_drones(self, agents):
-        """Draw drones on the map with status indicators"""
-        for agent in agents:
-            # Update drone paths for visualization
-            if agent.id not in self.drone_paths:
-                self.drone_paths[agent.id] = []
-            
-            # Only add new positions to reduce memory usage
-            if not self.drone_paths[agent.id] or self.drone_paths[agent.id][-1] != agent.pos:
-                self.drone_paths[agent.id].append(agent.pos)
-                # Limit path length to prevent performance issues
-                if len(self.drone_paths[agent.id]) > 30:
-                    self.drone_paths[agent.id] = self.drone_paths[agent.id][-30:]
-            
-            # Simulated flight altitude using shadow
-            shadow_y_offset = 5  # Pixels below the drone
-            shadow_alpha = 100   # Transparency of shadow
-            
-            # Draw shadow
-            shadow_surface = pygame.Surface((self.cell_size // 2, self.cell_size // 4), pygame.SRCALPHA)
-            pygame.draw.ellipse(shadow_surface, (0, 0, 0, shadow_alpha), 
-                              (0, 0, self.cell_size // 2, self.cell_size // 4))
-            self.screen.blit(shadow_surface, 
-                           (agent.pos[1] * self.cell_size + self.cell_size // 4, 
-                            agent.pos[0] * self.cell_size + self.cell_size // 2 + shadow_y_offset))
-            
-            # Draw the drone
-            if agent.is_byzantine:
-                self.screen.blit(self.images["byzantine_drone"], 
-                               (agent.pos[1] * self.cell_size, agent.pos[0] * self.cell_size))
-            else:
-                self.screen.blit(self.images["normal_drone"], 
-                               (agent.pos[1] * self.cell_size, agent.pos[0] * self.cell_size))
-            
-            # Draw battery status indicator
-            battery_level = max(0, 1 - (agent.step / 120))  # Battery depletes as drone moves
+    def _refill_rand_pool(self):
+        """Draw a new batch of uniform samples for per-frame effects"""
+        self._rand_pool = self._rng.random(RAND_POOL_SIZE).tolist()
+        self._rand_idx = 0
+
+    def _next_rand(self):
+        """Next uniform sample in [0, 1) from the per-frame pool"""
+        if self._rand_idx == RAND_POOL_SIZE:
+            self._refill_rand_pool()
+        value = self._rand_pool[self._rand_idx]
+        self._rand_idx += 1
+        return value
+
+    def _label(self, text, color=(255, 255, 255)):
+        """Small font label, rendered on first use and cached.
+
+        Only use for text from a small fixed set (ids, wind strength names),
+        the cache is never pruned.
+        """
+        key = (text, color)
+        label = self._label_cache.get(key)
+        if label is None:
+            label = self.small_font.render(text, True, color).convert_alpha()
+            self._label_cache[key] = label
+        return label
+
+    def _render_shadow(self):
+        """Render the translucent ellipse drawn under every drone"""
+        shadow_surface = pygame.Surface((self.cell_size // 2, self.cell_size // 4), pygame.SRCALPHA)
+        pygame.draw.ellipse(shadow_surface, (0, 0, 0, 100), 
+                          (0, 0, self.cell_size // 2, self.cell_size // 4))
+        return shadow_surface.convert_alpha()
+
+    def _battery_sprite(self, bucket, color_idx):
+        """Battery indicator filled to bucket/BATTERY_BUCKETS in _battery_palette[color_idx]"""
+        sprite = self._battery_sprites.get((bucket, color_idx))
+        if sprite is None:
             battery_width = self.cell_size // 2
             battery_height = 3
+            sprite = pygame.Surface((battery_width, battery_height), pygame.SRCALPHA)
+            # Outline, then the fill inset by one pixel
+            pygame.draw.rect(sprite, (50, 50, 50), (0, 0, battery_width, battery_height), 1)
+            fill_width = int(battery_width * bucket / BATTERY_BUCKETS) - 2
+            if fill_width > 0:
+                pygame.draw.rect(sprite, self._battery_palette[color_idx], 
+                               (1, 1, fill_width, battery_height - 2))
+            sprite = sprite.convert_alpha()
+            self._battery_sprites[(bucket, color_idx)] = sprite
+        return sprite
+
+    def _drone_image(self, agent, bucket, color_idx):
+        """Drone with its shadow, battery indicator and id, composed once per state.
+
+        The image starts 5 pixels above the drone's cell to fit the battery indicator.
+        """
+        key = (agent.is_byzantine, agent.id, bucket, color_idx)
+        image = self._drone_images.get(key)
+        if image is None:
+            image = pygame.Surface((self.cell_size, self.cell_size + 10), pygame.SRCALPHA)
             
-            # Battery color changes with level
-            if battery_level > 0.6:
-                battery_color = self.colors["battery_good"]
-            elif battery_level > 0.3:
-                battery_color = self.colors["battery_med"]
-            else:
-                battery_color = self.colors["battery_low"]
-            
-            # Draw battery outline
-            pygame.draw.rect(self.screen, (50, 50, 50), 
-                           (agent.pos[1] * self.cell_size + self.cell_size // 4, 
-                            agent.pos[0] * self.cell_size - battery_height - 2,
-                            battery_width, battery_height), 1)
-            
-            # Draw battery fill
-            pygame.draw.rect(self.screen, battery_color, 
-                           (agent.pos[1] * self.cell_size + self.cell_size // 4 + 1, 
-                            agent.pos[0] * self.cell_size - battery_height - 1,
-                            int(battery_width * battery_level) - 2, battery_height - 2))
-            
-            # Draw drone ID
-            id_text = self.small_font.render(f"D{agent.id}", True, (255, 255, 255))
-            id_rect = id_text.get_rect(center=(
-                agent.pos[1] * self.cell_size + self.cell_size // 2,
-                agent.pos[0] * self.cell_size + self.cell_size // 2
-            ))
-            self.screen.blit(id_text, id_rect)
+            # Shadow (simulated flight altitude, 5 pixels below the drone)
+            shadow_y_offset = 5
+            image.blit(self._shadow_surface, 
+                       (self.cell_size // 4, 5 + self.cell_size // 2 + shadow_y_offset))
             
-            # Occasionally show communication signal animation
-            if not agent.is_byzantine and agent.knowledge and random.random() < 0.05:
-                self._add_communication_signal(agent.pos, 15)
+            # The drone
+            image.blit(self.images["byzantine_drone" if agent.is_byzantine else "normal_drone"], (0, 5))
+            
+            # Battery status indicator
+            image.blit(self._battery_sprite(bucket, color_idx), (self.cell_size // 4, 0))
+            
+            # Drone ID
+            id_text = self._label(f"D{agent.id}")
+            image.blit(id_text, id_text.get_rect(center=(self.cell_size // 2, 5 + self.cell_size // 2)))
+            
+            image = image.convert_alpha()
+            self._drone_images[key] = image
+        return image
 
-    def _draw_customers(self, customers):
-        """Draw customers (delivery locations) on the map"""
-        for i, (cx, cy) in enumerate(customers):
-            # Draw building with package
-            building_img = self.images["building"]
-            self.screen.blit(building_img, 
-                           (cy * self.cell_size + (self.cell_size - building_img.get_width()) // 2, 
-                            cx * self.cell_size + (self.cell_size - building_img.get_height()) // 2))
+    def _customer_image(self, index, waving):
+        """Customer building with package, id and waiting person, one cell in size"""
+        key = (index, waving)
+        image = self._customer_images.get(key)
+        if image is None:
+            image = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
             
-            # Draw package on top of building
+            # Building with package on top
+            building_img = self.images["building"]
+            image.blit(building_img, ((self.cell_size - building_img.get_width()) // 2, 
+                                      (self.cell_size - building_img.get_height()) // 2))
             package_img = self.images["package"]
-            self.screen.blit(package_img, 
-                           (cy * self.cell_size + (self.cell_size - package_img.get_width()) // 2, 
-                            cx * self.cell_size + (self.cell_size - package_img.get_height()) // 4))
-            
-            # Draw customer ID
-            id_text = self.small_font.render(f"C{i}", True, (255, 255, 255))
-            id_rect = id_text.get_rect(center=(
-                cy * self.cell_size + self.cell_size // 2,
-                cx * self.cell_size + self.cell_size // 2 - self.cell_size // 4
-            ))
-            self.screen.blit(id_text, id_rect)
-            
-            # Draw person waiting (stick figure)
-            pygame.draw.circle(self.screen, (200, 150, 150), 
-                             (cy * self.cell_size + self.cell_size // 2, 
-                              cx * self.cell_size + self.cell_size // 2 + self.cell_size // 8), 
-                             3)  # Head
-            
-            pygame.draw.line(self.screen, (200, 150, 150), 
-                           (cy * self.cell_size + self.cell_size // 2, 
-                            cx * self.cell_size + self.cell_size // 2 + self.cell_size // 8 + 3),
-                           (cy * self.cell_size + self.cell_size // 2, 
-                            cx * self.cell_size + self.cell_size // 2 + self.cell_size // 4), 2)  # Body
+            image.blit(package_img, ((self.cell_size - package_img.get_width()) // 2, 
+                                     (self.cell_size - package_img.get_height()) // 4))
+            
+            # Customer ID
+            id_text = self._label(f"C{index}")
+            image.blit(id_text, id_text.get_rect(center=(self.cell_size // 2,
+                                                         self.cell_size // 2 - self.cell_size // 4)))
+            
+            # Person waiting
+            image.blit(self.images["person_waving" if waving else "person_idle"], (0, 0))
+            
+            image = image.convert_alpha()
+            self._customer_images[key] = image
+        return image
+
+    def _add_sprite(self, layer):
+        """New sprite in the entity group, drawn above sprites of lower layers"""
+        sprite = pygame.sprite.Sprite()
+        sprite.image = pygame.Surface((0, 0))
+        sprite.rect = sprite.image.get_rect()
+        self._sprites.add(sprite, layer=layer)
+        return sprite
+
+    def _draw_drones(self, agents):
+        """Place drone sprites on the map with status indicators"""
+        # Battery status of every drone at once; the battery depletes as the drone moves
+        steps = np.fromiter((agent.step for agent in agents), dtype=np.float32, count=len(agents))
+        levels = np.clip(1 - steps / 120.0, 0, 1)
+        # Battery color changes with level: low up to 0.3, medium up to 0.6, good above
+        color_idx = np.digitize(levels, BATTERY_THRESHOLDS, right=True).tolist()
+        buckets = np.rint(levels * BATTERY_BUCKETS).astype(np.int32).tolist()
+        
+        for n, agent in enumerate(agents):
+            # Update drone paths for visualization
+            self._record_path(agent)
+            
+            sprite = self._drone_sprites.get(agent.id)
+            if sprite is None:
+                sprite = self._drone_sprites[agent.id] = self._add_sprite(DRONE_LAYER)
+            sprite.image = self._drone_image(agent, buckets[n], color_idx[n])
+            sprite.rect = sprite.image.get_rect(topleft=(agent.pos[1] * self.cell_size,
+                                                         agent.pos[0] * self.cell_size - 5))
             
+            # Occasionally show communication signal animation
+            if not agent.is_byzantine and agent.knows.any() and self._next_rand() < 0.05:
+                self._add_communication_signal(agent.pos, 15)
+
+    def _draw_customers(self, customers):
+        """Place customer (delivery location) sprites on the map"""
+        # One sprite per remaining customer
+        while len(self._customer_sprites) < len(customers):
+            self._customer_sprites.append(self._add_sprite(CUSTOMER_LAYER))
+        while len(self._customer_sprites) > len(customers):
+            self._customer_sprites.pop().kill()
+        
+        for i, (cx, cy) in enumerate(customers.tolist()):
             # Occasionally make the person wave to show they're waiting
-            if random.random() < 0.1:
-                # Wave arm up
-                pygame.draw.line(self.screen, (200, 150, 150), 
-                               (cy * self.cell_size + self.cell_size // 2, 
-                                cx * self.cell_size + self.cell_size // 2 + self.cell_size // 8 + 5),
-                               (cy * self.cell_size + self.cell_size // 2 + 5, 
-                                cx * self.cell_size + self.cell_size // 2 + self.cell_size // 8 - 2), 2)  # Arm up
-            else:
-                # Normal arm position
-                pygame.draw.line(self.screen, (200, 150, 150), 
-                               (cy * self.cell_size + self.cell_size // 2, 
-                                cx * self.cell_size + self.cell_size // 2 + self.cell_size // 8 + 5),
-                               (cy * self.cell_size + self.cell_size // 2 + 5, 
-                                cx * self.cell_size + self.cell_size // 2 + self.cell_size // 8 + 5), 2)  # Arm
+            sprite = self._customer_sprites[i]
+            sprite.image = self._customer_image(i, self._next_rand() < 0.1)
+            sprite.rect = sprite.image.get_rect(topleft=(cy * self.cell_size, cx * self.cell_size))
 
     def _add_communication_signal(self, pos, frames=20):
         """Add a new communication signal animation"""
-        self.communication_signals.append({
-            "pos": pos,
-            "time": frames,
-            "frames": frames
-        })
+        self.communication_signals.add(pos, frames)
 
     def _process_animations(self):
         """Update and draw all animations"""
-        # Process delivery animations
-        remaining_deliveries = []
-        for anim in self.delivery_animations:
-            # Update animation
-            anim["time"] -= 1
-            
-            # Draw animation
-            if anim["time"] > 0:
-                # Scale the animation based on time
-                scale = 1.0 - (anim["frames"] - anim["time"]) / anim["frames"]
-                size = int(self.cell_size * 2 * scale)
+        # (surface, destination) pairs, blitted together once every animation is updated
+        blit_list = []
+        
+        # Process delivery animations: update, then lay out all of them at once
+        anims = self.delivery_animations
+        anims.tick()
+        n = len(anims)
+        if n:
+            # Scale the animation based on time
+            sizes, xs, ys = _compute_anim_geom(anims.time[:n], anims.frames[:n], anims.row[:n],
+                                               anims.col[:n], self.cell_size)
+            for size, x, y in zip(sizes.tolist(), xs.tolist(), ys.tolist()):
                 if size > 0:
-                    scaled_surface = pygame.transform.scale(
-                        self.images["delivery_effect"], (size, size))
-                    
-                    pos_x = anim["pos"][1] * self.cell_size + self.cell_size // 2 - size // 2
-                    pos_y = anim["pos"][0] * self.cell_size + self.cell_size // 2 - size // 2
-                    self.screen.blit(scaled_surface, (pos_x, pos_y))
+                    scaled_surface = self._scaled_effect_cache.get(size)
+                    if scaled_surface is None:
+                        scaled_surface = pygame.transform.scale(
+                            self.images["delivery_effect"], (size, size))
+                        self._scaled_effect_cache[size] = scaled_surface
+                    blit_list.append((scaled_surface, (x, y)))
                     
                     # Draw text
-                    delivered_text = self.info_font.render("Delivered!", True, (255, 255, 255))
-                    text_rect = delivered_text.get_rect(center=(
-                        anim["pos"][1] * self.cell_size + self.cell_size // 2,
-                        anim["pos"][0] * self.cell_size + self.cell_size // 2 - 5
-                    ))
-                    self.screen.blit(delivered_text, text_rect)
-                    
-                    # Keep animation active
-                    remaining_deliveries.append(anim)
-                    
-        self.delivery_animations = remaining_deliveries
+                    text_rect = self._delivered_text.get_rect(center=(x + size // 2, y + size // 2 - 5))
+                    blit_list.append((self._delivered_text, text_rect))
         
         # Process communication signals
-        remaining_signals = []
-        for signal in self.communication_signals:
-            # Update animation
-            signal["time"] -= 1
-            
-            # Draw animation
-            if signal["time"] > 0:
-                # Scale the animation based on time
-                scale = (signal["frames"] - signal["time"]) / signal["frames"]
+        signals = self.communication_signals
+        signals.tick()
+        n = len(signals)
+        if n:
+            center_x = signals.col[:n] * self.cell_size + self.cell_size // 2
+            center_y = signals.row[:n] * self.cell_size + self.cell_size // 2
+            for frames, time_left, cx, cy in zip(signals.frames[:n].tolist(), signals.time[:n].tolist(),
+                                                 center_x.tolist(), center_y.tolist()):
+                signal_surface = self._signal_ring_frames(frames)[time_left]
+                if signal_surface is not None:
+                    size = signal_surface.get_width()
+                    blit_list.append((signal_surface, (cx - size // 2, cy - size // 2)))
+        
+        # The returned rects are needed for the dirty-rect update
+        if blit_list:
+            self._frame_rects.extend(self.screen.blits(blit_list))
+
+    def _signal_ring_frames(self, frames):
+        """Signal ring for each remaining time of a frames long signal, None while too small"""
+        rings = self._signal_rings.get(frames)
+        if rings is None:
+            rings = [None]
+            for time_left in range(1, frames + 1):
+                # The ring grows and fades as the signal ages
+                scale = (frames - time_left) / frames
                 size = int(self.cell_size * 3 * scale)
                 if size > 0:
-                    # Create signal wave on-the-fly
-                    signal_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                    alpha = 150 * (1 - scale)
-                    pygame.draw.circle(signal_surface, (255, 255, 255, int(alpha)), 
+                    ring = pygame.Surface((size, size), pygame.SRCALPHA)
+                    pygame.draw.circle(ring, (255, 255, 255, int(150 * (1 - scale))), 
                                      (size//2, size//2), size//2, 1)
-                    
-                    pos_x = signal["pos"][1] * self.cell_size + self.cell_size // 2 - size // 2
-                    pos_y = signal["pos"][0] * self.cell_size + self.cell_size // 2 - size // 2
-                    self.screen.blit(signal_surface, (pos_x, pos_y))
-                    
-                    # Keep animation active
-                    remaining_signals.append(signal)
-        
-        self.communication_signals = remaining_signals
+                    rings.append(ring.convert_alpha())
+                else:
+                    rings.append(None)
+            self._signal_rings[frames] = rings
+        return rings
 
     def update_wind(self):
         """Update wind direction and strength periodically"""
@@ -674,19 +994,82 @@ class RealisticVisualizer:
             # Gradually change wind
             self.wind_direction = (self.wind_direction + random.randint(-20, 20)) % 360
             self.wind_strength = max(0, min(0.5, self.wind_strength + random.uniform(-0.1, 0.1)))
+            self._update_wind_geometry()
+            self._dashboard_changed = True
 
-    def _draw_dashboard(self, step, competitive_ratio, delivered=0, total=3):
-        """Draw detailed dashboard at the bottom"""
+    def _update_wind_geometry(self):
+        """Recompute the dashboard wind arrow and label after the wind changes"""
+        # Arrow tip relative to the indicator center, and head ends relative to the tip
+        wind_length = 20 * self.wind_strength
+        d = self.wind_direction
+        angles = np.radians(np.array([d, d + 140, d - 140]))
+        cos, sin = np.cos(angles).tolist(), np.sin(angles).tolist()
+        self._wind_end = (wind_length * cos[0], wind_length * sin[0])
+        self._wind_head1 = (8 * cos[1], 8 * sin[1])
+        self._wind_head2 = (8 * cos[2], 8 * sin[2])
+        self._wind_strength_label = ["Calm", "Light", "Moderate", "Strong"][
+            min(3, int(self.wind_strength * 8))]
+
+    def _prerender_static_text(self):
+        """Render the dashboard and results panel strings that never change"""
+        text = self.colors["text"]
+        specs = [
+            # Dashboard
+            ("Drone Delivery Management System", self.title_font, text),
+            ("Wind:", self.info_font, text),
+            ("System Status: Normal", self.info_font, self.colors["battery_good"]),
+            ("Press SPACE to pause/resume | ESC to exit", self.small_font, text),
+            # Results panel
+            ("Drone Delivery Mission Report", self.title_font, (255, 255, 255)),
+            ("Efficiency Analysis", self.header_font, text),
+            ("Mission History", self.header_font, text),
+            (HISTORY_HEADER, self.mono_font, (100, 100, 100)),
+            ("Launch New Mission", self.info_font, (255, 255, 255)),
+            ("Exit System", self.info_font, (255, 255, 255)),
+        ]
+        specs += [(status, self.header_font, color) for status, color in
+                  zip(MISSION_STATUSES, [(231, 76, 60), (243, 156, 18), (46, 204, 113)])]
+        specs += [(RATING_LABEL.format(rating), self.info_font, text) for rating in RATINGS]
+        self._static_text = {string: font.render(string, True, color).convert_alpha()
+                             for string, font, color in specs}
+
+    def _dashboard_value(self, key, value, text, font):
+        """Rendered dashboard text for key, re-rendered only when value changes"""
+        cached = self._dashboard_text.get(key)
+        if cached is None or cached[0] != value:
+            cached = (value, font.render(text, True, self.colors["text"]).convert_alpha())
+            self._dashboard_text[key] = cached
+            self._dashboard_changed = True
+        return cached[1]
+
+    def _draw_dashboard_chrome(self, surface):
+        """Draw the parts of the dashboard that never change onto surface"""
         # Dashboard background
-        pygame.draw.rect(self.screen, self.colors["panel"], 
+        pygame.draw.rect(surface, self.colors["panel"], 
                         (0, self.window_size, self.window_size, 150))
-        pygame.draw.line(self.screen, (150, 150, 150),
+        pygame.draw.line(surface, (150, 150, 150),
                         (0, self.window_size),
                         (self.window_size, self.window_size), 2)
         
         # Dashboard title
-        title = self.title_font.render("Drone Delivery Management System", True, self.colors["text"])
-        self.screen.blit(title, (20, self.window_size + 10))
+        title = self._static_text["Drone Delivery Management System"]
+        surface.blit(title, (20, self.window_size + 10))
+        
+        # Weather and system status labels
+        metrics_y = self.window_size + 45
+        weather_x = self.window_size - 200
+        surface.blit(self._static_text["Wind:"], (weather_x, metrics_y))
+        surface.blit(self._static_text["System Status: Normal"], (weather_x, metrics_y + 50))
+        
+        # Add instructions
+        instructions = self._static_text["Press SPACE to pause/resume | ESC to exit"]
+        surface.blit(instructions, (20, self.window_size + 120))
+
+    def _draw_dashboard(self, step, competitive_ratio, delivered=0, total=3):
+        """Draw detailed dashboard at the bottom"""
+        # Restore the chrome from the background (all of it comes with a full redraw)
+        if not self._full_redraw:
+            self.screen.blit(self._bg_surface, self._dashboard_rect, self._dashboard_rect)
         
         # Display time of day
         time_hours = int(self.time_of_day)
@@ -696,101 +1079,96 @@ class RealisticVisualizer:
         if display_hours == 0:
             display_hours = 12
             
-        time_text = self.header_font.render(
-            f"Time: {display_hours:02d}:{time_minutes:02d} {am_pm}", 
-            True, self.colors["text"])
+        time_text = self._dashboard_value(
+            "time", (time_hours, time_minutes),
+            f"Time: {display_hours:02d}:{time_minutes:02d} {am_pm}", self.header_font)
         self.screen.blit(time_text, (self.window_size - 150, self.window_size + 10))
         
         # Main metrics section
         metrics_y = self.window_size + 45
         
         # Step count
-        step_text = self.info_font.render(f"Flight Time: {step} minutes", True, self.colors["text"])
+        step_text = self._dashboard_value("step", step, f"Flight Time: {step} minutes", self.info_font)
         self.screen.blit(step_text, (20, metrics_y))
         
         # Competitive ratio
-        ratio_text = self.info_font.render(f"Efficiency Rating: {competitive_ratio:.2f}", True, self.colors["text"])
+        ratio_text = self._dashboard_value("ratio", round(competitive_ratio, 2),
+                                           f"Efficiency Rating: {competitive_ratio:.2f}", self.info_font)
         self.screen.blit(ratio_text, (20, metrics_y + 25))
         
         # Delivery status
-        delivery_text = self.info_font.render(f"Deliveries: {delivered}/{total}", 
-                                            True, self.colors["text"])
+        delivery_text = self._dashboard_value("delivery", (delivered, total),
+                                              f"Deliveries: {delivered}/{total}", self.info_font)
         self.screen.blit(delivery_text, (20, metrics_y + 50))
         
         # Weather information section
         weather_x = self.window_size - 200
         
-        # Wind indicator
-        wind_text = self.info_font.render("Wind:", True, self.colors["text"])
-        self.screen.blit(wind_text, (weather_x, metrics_y))
-        
-        # Draw wind direction arrow
-        wind_strength_text = ["Calm", "Light", "Moderate", "Strong"][
-            min(3, int(self.wind_strength * 8))]
+        # Draw wind direction arrow (geometry kept up to date by update_wind)
         wind_center = (weather_x + 100, metrics_y + 12)
-        wind_length = 20 * self.wind_strength
-        wind_end_x = wind_center[0] + wind_length * math.cos(math.radians(self.wind_direction))
-        wind_end_y = wind_center[1] + wind_length * math.sin(math.radians(self.wind_direction))
+        wind_end_x = wind_center[0] + self._wind_end[0]
+        wind_end_y = wind_center[1] + self._wind_end[1]
         
         # Arrow line
         pygame.draw.line(self.screen, self.colors["text"], 
                        wind_center, (wind_end_x, wind_end_y), 2)
         
         # Arrow head
-        arrow_angle1 = math.radians(self.wind_direction + 140)
-        arrow_angle2 = math.radians(self.wind_direction - 140)
-        arrow_head1 = (wind_end_x + 8 * math.cos(arrow_angle1), 
-                      wind_end_y + 8 * math.sin(arrow_angle1))
-        arrow_head2 = (wind_end_x + 8 * math.cos(arrow_angle2), 
-                      wind_end_y + 8 * math.sin(arrow_angle2))
+        arrow_head1 = (wind_end_x + self._wind_head1[0], wind_end_y + self._wind_head1[1])
+        arrow_head2 = (wind_end_x + self._wind_head2[0], wind_end_y + self._wind_head2[1])
         pygame.draw.line(self.screen, self.colors["text"], 
                        (wind_end_x, wind_end_y), arrow_head1, 2)
         pygame.draw.line(self.screen, self.colors["text"], 
                        (wind_end_x, wind_end_y), arrow_head2, 2)
         
         # Wind strength text
-        strength_text = self.small_font.render(wind_strength_text, True, self.colors["text"])
+        strength_text = self._label(self._wind_strength_label, self.colors["text"])
         self.screen.blit(strength_text, (weather_x + 50, metrics_y + 25))
-        
-        # System status
-        status_text = self.info_font.render("System Status: Normal", True, self.colors["battery_good"])
-        self.screen.blit(status_text, (weather_x, metrics_y + 50))
-        
-        # Add instructions
-        instructions = self.small_font.render(
-            "Press SPACE to pause/resume | ESC to exit", True, self.colors["text"])
-        self.screen.blit(instructions, (20, self.window_size + 120))
 
     def add_delivery_animation(self, pos):
         """Add a new delivery animation at the given position"""
-        self.delivery_animations.append({
-            "pos": pos,
-            "time": 20,  # Animation frames
-            "frames": 20
-        })
+        self.delivery_animations.add(pos, 20)  # Animation frames
 
     def show_results(self, steps, competitive_ratio, delivered, total_customers):
         """Show results panel with simulation statistics and history"""
         self.show_results_panel = True
         
         # Add current simulation to history
-        self.simulation_history.append({
+        latest = {
             'steps': steps,
             'ratio': competitive_ratio,
             'delivered': delivered,
             'total': total_customers,
             'timestamp': time.strftime("%H:%M:%S", time.localtime())
-        })
-
-    def draw_results_panel(self):
-        """Draw the results panel with history and buttons"""
-        if not self.show_results_panel:
-            return
+        }
+        self.simulation_history.append(latest)
+        self._results_panel_dirty = True
         
-        # Create panel surface
-        panel_width = self.window_size - 100
-        panel_height = self.window_size - 100
-        panel = pygame.Surface((panel_width, panel_height))
+        # Results text only changes when a simulation finishes, render it here
+        # rather than on every frame the panel is shown
+        success_rate = delivered / total_customers * 100
+        efficiency = max(0, min(1, 1 / competitive_ratio))
+        result_text = [
+            f"Drone Fleet Mission #{len(self.simulation_history)} - {latest['timestamp']}",
+            f"Flight Time: {steps} minutes",
+            f"Efficiency Rating: {competitive_ratio:.2f}",
+            f"Deliveries Completed: {delivered}/{total_customers} ({success_rate:.1f}%)"
+        ]
+        self._result_lines = [self.info_font.render(text, True, self.colors["text"]).convert_alpha()
+                              for text in result_text]
+        self._pct_text = self.small_font.render(f"{efficiency*100:.1f}%", True, (255, 255, 255)).convert_alpha()
+        
+        # History rows never change once added
+        rating = RATINGS[min(3, int(efficiency * 4))]
+        latest['_row_surface'] = self.mono_font.render(
+            f"{len(self.simulation_history):<3} {latest['timestamp']:10} {f'{steps}m':10} {competitive_ratio:<12.2f} "
+            f"{f'{delivered}/{total_customers} ({success_rate:.0f}%)':12} {rating:10}",
+            True, self.colors["text"]
+        ).convert_alpha()
+
+    def _render_results_panel(self, panel_width, panel_height):
+        """Draw the results panel contents onto a new surface"""
+        panel = pygame.Surface((panel_width, panel_height)).convert()
         panel.fill((250, 250, 250))  # White background
         
         # Add border and header styling
@@ -798,7 +1176,7 @@ class RealisticVisualizer:
         pygame.draw.rect(panel, (52, 73, 94), (0, 0, panel_width, 50))
         
         # Add title
-        title = self.title_font.render("Drone Delivery Mission Report", True, (255, 255, 255))
+        title = self._static_text["Drone Delivery Mission Report"]
         title_rect = title.get_rect(centerx=panel_width//2, centery=25)
         panel.blit(title, title_rect)
         
@@ -809,34 +1187,23 @@ class RealisticVisualizer:
         # Success indicator
         success_rate = latest['delivered'] / latest['total'] * 100
         if success_rate >= 90:
-            status_text = "MISSION SUCCESSFUL"
-            status_color = (46, 204, 113)
+            status_text = MISSION_STATUSES[2]
         elif success_rate >= 50:
-            status_text = "MISSION PARTIAL SUCCESS"
-            status_color = (243, 156, 18)
+            status_text = MISSION_STATUSES[1]
         else:
-            status_text = "MISSION NEEDS IMPROVEMENT"
-            status_color = (231, 76, 60)
+            status_text = MISSION_STATUSES[0]
             
-        status = self.header_font.render(status_text, True, status_color)
+        status = self._static_text[status_text]
         status_rect = status.get_rect(centerx=panel_width//2, y=latest_y)
         panel.blit(status, status_rect)
         
-        # Draw latest simulation results
-        result_text = [
-            f"Drone Fleet Mission #{len(self.simulation_history)} - {latest['timestamp']}",
-            f"Flight Time: {latest['steps']} minutes",
-            f"Efficiency Rating: {latest['ratio']:.2f}",
-            f"Deliveries Completed: {latest['delivered']}/{latest['total']} ({success_rate:.1f}%)"
-        ]
-        
-        for i, text in enumerate(result_text):
-            result_line = self.info_font.render(text, True, self.colors["text"])
+        # Draw latest simulation results (rendered by show_results)
+        for i, result_line in enumerate(self._result_lines):
             panel.blit(result_line, (30, latest_y + 30 + i * 30))
         
         # Draw efficiency chart (simple bar)
         chart_y = latest_y + 150
-        chart_label = self.header_font.render("Efficiency Analysis", True, self.colors["text"])
+        chart_label = self._static_text["Efficiency Analysis"]
         panel.blit(chart_label, (30, chart_y))
         
         # Draw bar
@@ -845,7 +1212,7 @@ class RealisticVisualizer:
         bar_x = 30
         bar_y = chart_y + 30
         # Background bar (gray)
-        pygame.draw.rect(panel, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height))
+        panel.fill((200, 200, 200), (bar_x, bar_y, bar_width, bar_height))
         
         # Calculate efficiency percentage (competitive ratio of 1 is perfect, >3 is poor)
         efficiency = max(0, min(1, 1 / latest['ratio']))
@@ -858,20 +1225,19 @@ class RealisticVisualizer:
         else:
             bar_color = self.colors["battery_low"]
             
-        pygame.draw.rect(panel, bar_color, (bar_x, bar_y, int(bar_width * efficiency), bar_height))
+        panel.fill(bar_color, (bar_x, bar_y, int(bar_width * efficiency), bar_height))
         
         # Add percentage text
-        pct_text = self.small_font.render(f"{efficiency*100:.1f}%", True, (255, 255, 255))
-        panel.blit(pct_text, (bar_x + 5, bar_y + 2))
+        panel.blit(self._pct_text, (bar_x + 5, bar_y + 2))
         
         # Rating text
-        rating_text = ["Poor", "Fair", "Good", "Excellent"][min(3, int(efficiency * 4))]
-        rating = self.info_font.render(f"Rating: {rating_text}", True, self.colors["text"])
+        rating_text = RATINGS[min(3, int(efficiency * 4))]
+        rating = self._static_text[RATING_LABEL.format(rating_text)]
         panel.blit(rating, (bar_x + bar_width + 20, bar_y))
         
         # Draw history section
         history_y = chart_y + 80
-        history_title = self.header_font.render("Mission History", True, self.colors["text"])
+        history_title = self._static_text["Mission History"]
         panel.blit(history_title, (30, history_y))
         
         # Show history entries
@@ -880,47 +1246,51 @@ class RealisticVisualizer:
         start_idx = max(0, len(self.simulation_history) - max_entries)
         
         # Column headers
-        header_text = self.small_font.render(
-            f"{'#':3} {'Time':10} {'Duration':10} {'Efficiency':12} {'Deliveries':12} {'Rating':10}", 
-            True, (100, 100, 100))
+        header_text = self._static_text[HISTORY_HEADER]
         panel.blit(header_text, (30, history_entries_y - 20))
         
         for i, hist in enumerate(self.simulation_history[start_idx:]):
-            # Calculate efficiency and rating
-            eff = max(0, min(1, 1 / hist['ratio']))
-            rating = ["Poor", "Fair", "Good", "Excellent"][min(3, int(eff * 4))]
-            
-            # Format text
-            history_line = self.small_font.render(
-                f"{start_idx + i + 1:2} {hist['timestamp']:10} {hist['steps']:8}m {hist['ratio']:10.2f} "
-                f"{hist['delivered']}/{hist['total']} ({hist['delivered']/hist['total']*100:.0f}%) {rating:10}",
-                True, self.colors["text"]
-            )
-            panel.blit(history_line, (30, history_entries_y + i * 25))
+            # Each row was rendered by show_results when its simulation ended
+            panel.blit(hist['_row_surface'], (30, history_entries_y + i * 25))
         
         # Draw buttons
-        button_y = panel_height - 70
+        button_y = panel_height - RESULTS_BUTTON_OFFSET
         
         # Run Again button (green)
         pygame.draw.rect(panel, self.colors["button_run"], 
                         (panel_width//4 - 100, button_y, 180, 40), border_radius=5)
-        run_text = self.info_font.render("Launch New Mission", True, (255, 255, 255))
+        run_text = self._static_text["Launch New Mission"]
         run_text_rect = run_text.get_rect(center=(panel_width//4 - 10, button_y + 20))
         panel.blit(run_text, run_text_rect)
         
         # Close button (red)
         pygame.draw.rect(panel, self.colors["button_close"], 
                         (3*panel_width//4 - 80, button_y, 180, 40), border_radius=5)
-        close_text = self.info_font.render("Exit System", True, (255, 255, 255))
+        close_text = self._static_text["Exit System"]
         close_text_rect = close_text.get_rect(center=(3*panel_width//4 + 10, button_y + 20))
         panel.blit(close_text, close_text_rect)
         
+        return panel
+
+    def draw_results_panel(self):
+        """Draw the results panel with history and buttons"""
+        if not self.show_results_panel:
+            return
+        
+        # The panel only changes when a simulation finishes, redraw it then
+        panel_width = self.window_size - 100
+        panel_height = self.window_size - 100
+        if self._results_panel_dirty:
+            self._results_panel_surface = self._render_results_panel(panel_width, panel_height)
+            self._results_panel_dirty = False
+        
         # Display panel centered on screen
         panel_x = (self.window_size - panel_width) // 2
         panel_y = (self.window_size - panel_height) // 2
-        self.screen.blit(panel, (panel_x, panel_y))
+        self.screen.blit(self._results_panel_surface, (panel_x, panel_y))
         
         # Store button rectangles for click detection
+        button_y = panel_height - RESULTS_BUTTON_OFFSET
         self.run_button_rect = pygame.Rect(
             panel_x + panel_width//4 - 100,
             panel_y + button_y, 
@@ -934,35 +1304,60 @@ class RealisticVisualizer:
 
     def update_display(self, env, agents, step, competitive_ratio, delivered=0):
         """Update the entire display"""
+        # Fresh random samples for this frame's effects
+        self._refill_rand_pool()
+        
         # Update environment states
         self.update_wind()
         
         # Draw everything
-        self._draw_sky()
+        self._frame_rects = []
         self._draw_environment()
         self._draw_drone_paths(agents)
         self._draw_customers(env.customers)
         self._draw_drones(agents)
+        self._frame_rects.extend(self._sprites.draw(self.screen))
         self._process_animations()
-        self._draw_dashboard(step, competitive_ratio, delivered, len(env.customers) + delivered)
+        self._draw_dashboard(step, competitive_ratio, delivered, env.total_customers)
         
         # Draw results panel if active
         if self.show_results_panel:
             self.draw_results_panel()
         
-        # Update display and maintain framerate
-        pygame.display.flip()
+        # Update display: everything after a repaint or under the results panel,
+        # otherwise only what changed since the last frame, and nothing at all
+        # when the frame matches the one already on screen
+        if self._full_redraw or self.show_results_panel:
+            pygame.display.flip()
+        else:
+            rects = self._prev_rects + self._frame_rects
+            if self._dashboard_changed:
+                rects.append(self._dashboard_rect)
+            if rects:
+                pygame.display.update(rects)
+        self._prev_rects = self._frame_rects
+        self._full_redraw = False
+        self._dashboard_changed = False
+        
+        # Update time of day for next frame
+        self.time_of_day = (self.time_of_day + self.day_cycle_speed) % 24
+        
+        # Maintain framerate
         self.clock.tick(10)  # 10 FPS
 
     def reset_for_new_simulation(self):
         """Reset visualization state for a new simulation run"""
-        self.drone_paths = {}
-        self.delivery_animations = []
-        self.communication_signals = []
+        self._reset_paths()
+        self.delivery_animations.clear()
+        self.communication_signals.clear()
         self.show_results_panel = False
+        self._results_panel_dirty = True
         
         # Regenerate a new environment with different building placements
         self.environment = self._generate_environment()
+        self._env_surface = self._render_environment()
+        self._bg_dirty = True
+        self._prev_rects = []
 
 
 def visualize(env, agents, step=0, competitive_ratio=0.0, delivered=0):
@@ -976,9 +1371,9 @@ def visualize(env, agents, step=0, competitive_ratio=0.0, delivered=0):
     visualize.viz.update_display(env, agents, step, competitive_ratio, delivered)
     
     # Check for delivery and add animation
+    customer_set = set(map(tuple, env.customers.tolist()))
     for agent in agents:
-        for i, (cx, cy) in enumerate(env.customers[:]):
-            if agent.pos == (cx, cy):
-                visualize.viz.add_delivery_animation((cx, cy))
+        if agent.pos in customer_set:
+            visualize.viz.add_delivery_animation(agent.pos)
                 
     return visualize.viz
\ No newline at end of file